@@ -15,6 +15,11 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
+_NEXT_DATA_RE = re.compile(
+    r'<script id="__NEXT_DATA__"[^>]*type="application/json"[^>]*>(.*?)</script>', re.DOTALL
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 async def fetch_article_body(
     url: str,
@@ -64,7 +69,7 @@ def _extract_body_from_html(html: str, url: str) -> Optional[str]:
 
 def _extract_from_next_data(html: str) -> Optional[str]:
     """Extract article body from Next.js __NEXT_DATA__ script."""
-    m = re.search(r'<script id="__NEXT_DATA__"[^>]*type="application/json"[^>]*>(.*?)</script>', html, re.DOTALL)
+    m = _NEXT_DATA_RE.search(html)
     if not m:
         return None
     try:
@@ -148,5 +153,5 @@ def _extract_from_selectors(html: str, url: str) -> Optional[str]:
 
 def _normalize_text(s: str, max_len: int = 100_000) -> str:
     """Collapse whitespace and truncate."""
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WHITESPACE_RE.sub(" ", s).strip()
     return s[:max_len] if len(s) > max_len else s
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import logging
 import re
@@ -9,7 +10,7 @@ import unicodedata
 from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any
-from urllib.parse import urlparse, urlunparse
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 from backend.denoise.filters import ItemRecord
 
@@ -43,11 +44,13 @@ def _generate_hash_funcs(num_perm: int, seed: int = 42) -> list[tuple[int, int]]
 _DEFAULT_NUM_PERM = 128
 _HASH_FUNCS = _generate_hash_funcs(_DEFAULT_NUM_PERM)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def _shingle(text: str, k: int = 3) -> set[int]:
     """Convert text to a set of k-character shingle hashes."""
     text = text.lower().strip()
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     if len(text) < k:
         return {hash(text) & _MAX_HASH}
     return {hash(text[i : i + k]) & _MAX_HASH for i in range(len(text) - k + 1)}
@@ -114,25 +117,35 @@ class LSHIndex:
 # URL canonicalization
 # ---------------------------------------------------------------------------
 
+_TRACKING_PARAMS = frozenset({
+    "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
+    "ref", "source", "fbclid", "gclid",
+})
+
+
+# Cached: feeds re-serve the same URLs on every poll, and re-ingest passes
+# canonicalize URLs that were already seen
+@functools.lru_cache(maxsize=65536)
 def canonical_url(url: str) -> str:
-    """Normalize a URL for dedup comparison (strip tracking params, fragments, etc.)."""
+    """Normalize a URL for dedup comparison.
+
+    Upgrades http to https, lowercases the host and drops ``www.``, strips
+    fragments, trailing slashes and tracking params, and sorts the query.
+    """
     try:
         parsed = urlparse(url.strip())
-        # Drop fragment, lowercase scheme and host
         scheme = parsed.scheme.lower()
+        if scheme == "http":
+            scheme = "https"
         netloc = parsed.netloc.lower().rstrip(".")
+        if netloc.startswith("www."):
+            netloc = netloc[4:]
         path = parsed.path.rstrip("/") or "/"
-        # Strip common tracking query params
-        _strip_params = {
-            "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
-            "ref", "source", "fbclid", "gclid",
-        }
         if parsed.query:
-            from urllib.parse import parse_qs, urlencode
-
-            qs = parse_qs(parsed.query, keep_blank_values=True)
-            filtered = {k: v for k, v in qs.items() if k.lower() not in _strip_params}
-            query = urlencode(filtered, doseq=True)
+            pairs = parse_qsl(parsed.query, keep_blank_values=True)
+            query = urlencode(sorted(
+                (k, v) for k, v in pairs if k.lower() not in _TRACKING_PARAMS
+            ))
         else:
             query = ""
         return urlunparse((scheme, netloc, path, "", query, ""))
@@ -143,7 +156,7 @@ def canonical_url(url: str) -> str:
 def _normalize_text(text: str) -> str:
     """Normalize unicode, collapse whitespace."""
     text = unicodedata.normalize("NFKC", text)
-    return re.sub(r"\s+", " ", text).strip().lower()
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
 
 
 # ---------------------------------------------------------------------------
@@ -76,6 +76,16 @@ class DigestGenerator:
         self.quota = QuotaManager(config)
         self.summarizer = LLMSummarizer(config)
 
+    async def __aenter__(self) -> DigestGenerator:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the summarizer's provider clients."""
+        await self.summarizer.aclose()
+
     async def generate_digest(
         self,
         items: list[ItemRecord],
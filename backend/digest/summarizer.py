@@ -5,12 +5,17 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
-from typing import Any
+from typing import Any, AsyncIterator
 
 from backend.denoise.filters import ItemRecord
 
 logger = logging.getLogger(__name__)
 
+SYSTEM_PROMPT = (
+    "You are a tech news analyst. Write a concise 1-2 sentence summary "
+    "explaining why this item matters for AI practitioners."
+)
+
 
 class LLMSummarizer:
     """Generate "why it matters" summaries using configurable LLM providers."""
@@ -28,6 +33,21 @@ class LLMSummarizer:
 
         # In-memory summary cache (keyed by content hash)
         self._cache: dict[str, str] = {}
+        # Provider SDK clients, created on first use and reused so their HTTP
+        # connection pools (keep-alive, TLS sessions) survive across calls
+        self._clients: dict[str, Any] = {}
+
+    async def __aenter__(self) -> LLMSummarizer:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close any provider clients (and their connection pools)."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.close()
 
     async def summarize(self, items: list[ItemRecord]) -> dict[str, str]:
         """Generate summaries for a list of items.
@@ -49,6 +69,10 @@ class LLMSummarizer:
                 to_summarize.append((item, cache_key))
 
         if to_summarize:
+            # Batch similar-length prompts together: every batch waits for its
+            # slowest request, so one long article no longer holds up a batch
+            # of short ones
+            to_summarize.sort(key=lambda pair: self._prompt_chars(pair[0]))
             # Process in batches of concurrent_requests
             for i in range(0, len(to_summarize), self.concurrent_requests):
                 batch = to_summarize[i : i + self.concurrent_requests]
@@ -65,8 +89,56 @@ class LLMSummarizer:
                     if self.cache_summaries:
                         self._cache[cache_key] = text
 
+            # Keep the caller's item order despite the length sort
+            results = {item.id: results[item.id] for item in items}
+
         return results
 
+    async def stream(self, item: ItemRecord) -> AsyncIterator[str]:
+        """Yield one item's summary as text deltas as the provider produces them.
+
+        The full text is cached like summarize() results. If the provider
+        fails before producing any text, the fallback summary is yielded.
+        """
+        cache_key = self._cache_key(item)
+        if self.cache_summaries and cache_key in self._cache:
+            yield self._cache[cache_key]
+            return
+
+        parts: list[str] = []
+        try:
+            async for delta in self._stream_one(item):
+                parts.append(delta)
+                yield delta
+        except Exception as e:
+            if parts:
+                raise
+            logger.warning("Summary stream failed for %s: %s", item.id, e)
+            parts = [self._fallback_summary(item)]
+            yield parts[0]
+
+        if self.cache_summaries:
+            self._cache[cache_key] = "".join(parts)
+
+    async def _stream_one(self, item: ItemRecord) -> AsyncIterator[str]:
+        """Dispatch a streaming request to the configured provider."""
+        prompt = self._build_prompt(item)
+
+        if self.provider == "openai":
+            stream = self._stream_openai(self._client("openai"), self.model, prompt)
+        elif self.provider == "local":
+            stream = self._stream_openai(self._client("local"), self.local_model, prompt)
+        elif self.provider == "anthropic":
+            stream = self._stream_anthropic(prompt)
+        else:
+            if self.provider != "mock":
+                logger.warning("Unknown provider %r, using mock", self.provider)
+            yield self._mock_summary(item)
+            return
+
+        async for delta in stream:
+            yield delta
+
     async def _summarize_one(self, item: ItemRecord) -> str:
         """Dispatch to the configured provider."""
         prompt = self._build_prompt(item)
@@ -88,13 +160,10 @@ class LLMSummarizer:
     # ------------------------------------------------------------------
 
     async def _call_openai(self, prompt: str) -> str:
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI()
-        resp = await client.chat.completions.create(
+        resp = await self._client("openai").chat.completions.create(
             model=self.model,
             messages=[
-                {"role": "system", "content": "You are a tech news analyst. Write a concise 1-2 sentence summary explaining why this item matters for AI practitioners."},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
             ],
             max_tokens=self.max_tokens,
@@ -103,26 +172,20 @@ class LLMSummarizer:
         return resp.choices[0].message.content or ""
 
     async def _call_anthropic(self, prompt: str) -> str:
-        from anthropic import AsyncAnthropic
-
-        client = AsyncAnthropic()
-        resp = await client.messages.create(
+        resp = await self._client("anthropic").messages.create(
             model=self.model or "claude-haiku-4-5-20251001",
             max_tokens=self.max_tokens,
-            system="You are a tech news analyst. Write a concise 1-2 sentence summary explaining why this item matters for AI practitioners.",
+            system=SYSTEM_PROMPT,
             messages=[{"role": "user", "content": prompt}],
         )
         return resp.content[0].text
 
     async def _call_local(self, prompt: str) -> str:
         """Call a local Ollama-compatible OpenAI API."""
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI(base_url=self.local_url, api_key="ollama")
-        resp = await client.chat.completions.create(
+        resp = await self._client("local").chat.completions.create(
             model=self.local_model,
             messages=[
-                {"role": "system", "content": "You are a tech news analyst. Write a concise 1-2 sentence summary explaining why this item matters for AI practitioners."},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
             ],
             max_tokens=self.max_tokens,
@@ -130,6 +193,51 @@ class LLMSummarizer:
         )
         return resp.choices[0].message.content or ""
 
+    def _client(self, provider: str) -> Any:
+        """Return the cached SDK client for a provider, creating it on first use."""
+        client = self._clients.get(provider)
+        if client is None:
+            if provider == "anthropic":
+                from anthropic import AsyncAnthropic
+
+                client = AsyncAnthropic()
+            elif provider == "local":
+                from openai import AsyncOpenAI
+
+                client = AsyncOpenAI(base_url=self.local_url, api_key="ollama")
+            else:
+                from openai import AsyncOpenAI
+
+                client = AsyncOpenAI()
+            self._clients[provider] = client
+        return client
+
+    async def _stream_openai(self, client: Any, model: str, prompt: str) -> AsyncIterator[str]:
+        """Stream chat completion deltas (OpenAI, or Ollama's compatible API)."""
+        resp = await client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            stream=True,
+        )
+        async for chunk in resp:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def _stream_anthropic(self, prompt: str) -> AsyncIterator[str]:
+        async with self._client("anthropic").messages.stream(
+            model=self.model or "claude-haiku-4-5-20251001",
+            max_tokens=self.max_tokens,
+            system=SYSTEM_PROMPT,
+            messages=[{"role": "user", "content": prompt}],
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -145,6 +253,11 @@ class LLMSummarizer:
             f"Summarize why this matters in 1-2 sentences."
         )
 
+    @staticmethod
+    def _prompt_chars(item: ItemRecord) -> int:
+        """Prompt size estimate used to group requests (content is capped at 800)."""
+        return len(item.title) + min(len(item.content or ""), 800)
+
     @staticmethod
     def _mock_summary(item: ItemRecord) -> str:
         """Template-based summary for testing (no API calls)."""
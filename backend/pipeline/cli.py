@@ -18,7 +18,6 @@ from pathlib import Path
 from typing import Optional
 
 import click
-import yaml
 from dotenv import load_dotenv
 
 # Load .env so GITHUB_TOKEN, QIITA_API_TOKEN, etc. are available when running from CLI
@@ -30,7 +29,7 @@ from backend.connectors.factory import build_connector
 from backend.denoise.filters import ItemRecord
 from backend.digest.generator import DigestGenerator
 from backend.digest.summarizer import LLMSummarizer
-from backend.pipeline.orchestrator import IngestOrchestrator
+from backend.pipeline.orchestrator import IngestOrchestrator, load_yaml_config
 from backend.storage.db import DatabaseManager
 from backend.storage.models import Digest as StorageDigest, Metric, Source
 
@@ -120,12 +119,10 @@ def sync_sources(ctx):
     """Sync config.yaml sources into the database (so they appear before first ingest)."""
 
     async def _run():
-        import yaml
         db = DatabaseManager(ctx.obj["db_path"])
         await db.initialize()
         try:
-            with open(ctx.obj["config_path"], "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            config = load_yaml_config(ctx.obj["config_path"])
             sources_cfg = config.get("sources", [])
             if not sources_cfg:
                 console.print("[yellow]No sources in config.[/yellow]")
@@ -313,8 +310,7 @@ def digest(ctx, digest_date: Optional[str]):
         await db.initialize()
         try:
             config_path = ctx.obj["config_path"]
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            config = load_yaml_config(config_path)
             if not config:
                 config = {}
 
@@ -351,8 +347,8 @@ def digest(ctx, digest_date: Optional[str]):
             item_records = [ItemRecord.from_db_row(item_to_row(i)) for i in items]
 
             with console.status("[bold green]Generating digest (filter, dedup, score, summarize)..."):
-                gen = DigestGenerator(config)
-                dig = await gen.generate_digest(item_records, digest_date=digest_date_obj)
+                async with DigestGenerator(config) as gen:
+                    dig = await gen.generate_digest(item_records, digest_date=digest_date_obj)
 
             # Build Metric rows for all items in the digest
             now = datetime.utcnow()
@@ -410,8 +406,7 @@ def summarize_favorites(ctx, item_id: Optional[str]):
         await db.initialize()
         try:
             config_path = ctx.obj["config_path"]
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            config = load_yaml_config(config_path)
             if not config:
                 config = {}
 
@@ -446,8 +441,8 @@ def summarize_favorites(ctx, item_id: Optional[str]):
                 return
 
             with console.status("[bold green]Summarizing favorites..."):
-                summarizer = LLMSummarizer(config)
-                summaries = await summarizer.summarize(records)
+                async with LLMSummarizer(config) as summarizer:
+                    summaries = await summarizer.summarize(records)
 
             for iid, summary in summaries.items():
                 await db.update_favorite_summary(iid, summary)
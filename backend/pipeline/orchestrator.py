@@ -7,15 +7,39 @@ deduplicates URLs, performs batch inserts, and saves snapshots.
 from __future__ import annotations
 
 import asyncio
+import copy
+import functools
+import gzip
 import hashlib
 import logging
+import os
+import threading
 import time
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Protocol
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    DefaultDict,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
+from urllib.parse import urlparse
 
 import yaml
 
+# libyaml's C loader parses several times faster; PyYAML may be built without it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from backend.storage.db import DatabaseManager
 from backend.storage.models import IngestResult, IngestSummary, Item, Source
 
@@ -25,8 +49,36 @@ DEFAULT_CONFIG_PATH = "config.yaml"
 DEFAULT_DB_PATH = "data/ainews.db"
 DEFAULT_SNAPSHOT_DIR = "data/snapshots"
 DEFAULT_MAX_CONCURRENT = 10
+DEFAULT_MAX_PER_HOST = 2
+# Minimum seconds between fetch starts to one host; 0 disables spacing
+DEFAULT_MIN_HOST_INTERVAL = 0.0
 DEFAULT_TIMEOUT = 30
 
+# Below this many URLs, hashing inline is cheaper than pickling to a worker
+CPU_POOL_THRESHOLD = 2000
+CPU_POOL_WORKERS = 2
+
+SNAPSHOT_WRITE_CHUNK = 64 * 1024
+# Fast gzip level: HTML compresses well even at low levels
+SNAPSHOT_GZIP_LEVEL = 3
+
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML config file; cached per (path, mtime) so edits are picked up."""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_yaml_config(path: str | os.PathLike[str]) -> Dict[str, Any]:
+    """Load a YAML config file, reusing the parse while the file is unchanged.
+
+    Returns a deep copy so callers may mutate the result freely.
+    """
+    path = os.fspath(path)
+    return copy.deepcopy(_parse_config(path, os.stat(path).st_mtime_ns))
+
 
 class Connector(Protocol):
     """Protocol for source connectors (implemented by Agent A)."""
@@ -36,32 +88,147 @@ class Connector(Protocol):
         ...
 
 
+class HostRateLimiter:
+    """Space fetch starts to the same host at least ``interval`` seconds apart.
+
+    Each caller reserves the next free start time for its host before
+    sleeping, so no lock is needed on the single event-loop thread.
+    """
+
+    def __init__(self, interval: float = DEFAULT_MIN_HOST_INTERVAL):
+        self.interval = interval
+        self._next_start: Dict[str, float] = {}
+
+    async def wait(self, host: str) -> None:
+        """Sleep until a fetch to ``host`` may start."""
+        if self.interval <= 0:
+            return
+        now = time.monotonic()
+        start = max(now, self._next_start.get(host, now))
+        self._next_start[host] = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
 class SnapshotManager:
-    """Save HTML snapshots to disk: data/snapshots/{source_id}/{date}/{hash}.html"""
+    """Save HTML snapshots to disk: data/snapshots/{source_id}/{date}/{hash[:2]}/{hash}.html
 
-    def __init__(self, base_dir: str = DEFAULT_SNAPSHOT_DIR):
-        self.base_dir = Path(base_dir)
+    The two-character shard level keeps any one directory to a few hundred
+    entries even for sources producing 10k+ snapshots a day.
+
+    With ``compress=True`` each snapshot is gzipped (``{hash}.html.gz``);
+    HTML usually shrinks several-fold, so fewer bytes hit the disk.
 
-    def save(self, source_id: str, url: str, content: str) -> str:
-        """Save content snapshot and return the relative path."""
-        date_str = datetime.utcnow().strftime("%Y-%m-%d")
-        url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()[:12]
+    Writes are never synced one by one. With ``durable=True`` the files
+    written since the last ``flush()`` are fdatasync'ed together there,
+    once per source batch; otherwise ``flush()`` is a no-op and the OS
+    writes them back on its own schedule.
+    """
 
-        dir_path = self.base_dir / source_id / date_str
-        dir_path.mkdir(parents=True, exist_ok=True)
+    def __init__(
+        self,
+        base_dir: str = DEFAULT_SNAPSHOT_DIR,
+        durable: bool = False,
+        compress: bool = False,
+    ):
+        self.base_dir = Path(base_dir)
+        self.compress = compress
+        self._suffix = ".html.gz" if compress else ".html"
+        # The save path joins plain strings; Path objects allocate per "/"
+        self._base_str = os.fspath(self.base_dir)
+        self.durable = durable
+        # (date, "YYYY-MM-DD"): reformatted only when the day rolls over
+        self._today: Tuple[date, str] = (date.min, "")
+        # Files written but not yet synced (durable mode); save_sync runs on
+        # worker threads, hence the lock
+        self._unsynced: List[str] = []
+        self._unsynced_lock = threading.Lock()
+
+    @property
+    def today_str(self) -> str:
+        """Today's UTC date as YYYY-MM-DD."""
+        return self._date_str()
+
+    def _date_str(self, now: Optional[datetime] = None) -> str:
+        day = (now or datetime.utcnow()).date()
+        if day != self._today[0]:
+            self._today = (day, day.strftime("%Y-%m-%d"))
+        return self._today[1]
+
+    def save_sync(
+        self,
+        source_id: str,
+        url: str,
+        content: str,
+        url_hash: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> str:
+        """Save content snapshot and return the relative path (blocking).
+
+        ``url_hash`` and ``now`` may be passed when precomputed for a batch.
+        """
+        file_path = self._path_for(source_id, url_hash or _url_hash(url), self._date_str(now))
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-        file_path = dir_path / f"{url_hash}.html"
-        file_path.write_text(content, encoding="utf-8")
+        opener = (
+            functools.partial(gzip.open, compresslevel=SNAPSHOT_GZIP_LEVEL)
+            if self.compress
+            else open
+        )
+        with opener(file_path, "wb") as f:
+            # Encode chunk by chunk so a multi-MB page is never held as str and bytes at once
+            for i in range(0, len(content), SNAPSHOT_WRITE_CHUNK):
+                f.write(content[i : i + SNAPSHOT_WRITE_CHUNK].encode("utf-8"))
+        if self.durable:
+            with self._unsynced_lock:
+                self._unsynced.append(file_path)
 
         # Return relative path from project root
-        return str(file_path)
+        return file_path
 
-    def exists(self, source_id: str, url: str) -> bool:
+    async def save(
+        self,
+        source_id: str,
+        url: str,
+        content: str,
+        url_hash: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> str:
+        """Save content snapshot without blocking the event loop.
+
+        The whole mkdir + write runs as one worker-thread call, which is
+        cheaper than an async file API that hops threads per operation.
+        """
+        return await asyncio.to_thread(self.save_sync, source_id, url, content, url_hash, now)
+
+    def flush_sync(self) -> int:
+        """fdatasync every file written since the last flush; return how many (blocking)."""
+        with self._unsynced_lock:
+            pending, self._unsynced = self._unsynced, []
+        for path in pending:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                _fdatasync(fd)
+            finally:
+                os.close(fd)
+        return len(pending)
+
+    async def flush(self) -> int:
+        """Sync pending snapshot files in one worker-thread call (no-op unless durable)."""
+        if not self._unsynced:
+            return 0
+        return await asyncio.to_thread(self.flush_sync)
+
+    def exists(self, source_id: str, url: str, url_hash: Optional[str] = None) -> bool:
         """Check if a snapshot already exists for today."""
-        date_str = datetime.utcnow().strftime("%Y-%m-%d")
-        url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()[:12]
-        file_path = self.base_dir / source_id / date_str / f"{url_hash}.html"
-        return file_path.exists()
+        return os.path.exists(
+            self._path_for(source_id, url_hash or _url_hash(url), self.today_str)
+        )
+
+    def _path_for(self, source_id: str, url_hash: str, date_str: str) -> str:
+        return os.path.join(
+            self._base_str, source_id, date_str, url_hash[:2], url_hash + self._suffix
+        )
 
 
 class IngestOrchestrator:
@@ -78,8 +245,10 @@ class IngestOrchestrator:
         db_path: str = DEFAULT_DB_PATH,
         snapshot_dir: str = DEFAULT_SNAPSHOT_DIR,
         connector_factory: Optional[Callable[[Dict[str, Any]], Connector]] = None,
-        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        max_concurrent: Optional[int] = None,
         request_timeout: int = DEFAULT_TIMEOUT,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        ingest_deadline: Optional[float] = None,
     ):
         self.config_path = config_path
         self.db_path = db_path
@@ -87,23 +256,55 @@ class IngestOrchestrator:
         self.connector_factory = connector_factory
         self.max_concurrent = max_concurrent
         self.request_timeout = request_timeout
+        self.max_per_host = max_per_host
+        self.ingest_deadline = ingest_deadline
         self.db: Optional[DatabaseManager] = None
         self.snapshots = SnapshotManager(snapshot_dir)
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+        # (config mtime_ns, config, parsed sources); rebuilt when the file changes
+        self._sources_cache: Optional[Tuple[int, Dict[str, Any], Tuple[Source, ...]]] = None
 
     def load_config(self) -> Dict[str, Any]:
         """Load and return the YAML configuration."""
-        with open(self.config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        return load_yaml_config(self.config_path)
+
+    def _load_sources(self) -> Tuple[Dict[str, Any], Tuple[Source, ...]]:
+        """Return the config and its Source objects, rebuilt only when the file changes."""
+        mtime_ns = os.stat(self.config_path).st_mtime_ns
+        cached = self._sources_cache
+        if cached is None or cached[0] != mtime_ns:
+            config = self.load_config() or {}
+            sources = tuple(Source.from_config(cfg) for cfg in config.get("sources", []))
+            cached = self._sources_cache = (mtime_ns, config, sources)
+        return cached[1], cached[2]
 
     async def initialize(self) -> None:
         """Initialize database and load config."""
+        self._configure_snapshots()
         self.db = DatabaseManager(self.db_path)
         await self.db.initialize()
+        # Workers are only spawned on first submit, i.e. on very large batches
+        self._cpu_pool = ProcessPoolExecutor(max_workers=CPU_POOL_WORKERS)
+
+    def _configure_snapshots(self) -> None:
+        """Rebuild the snapshot manager from ``performance.snapshots`` in the config."""
+        if not os.path.exists(self.config_path):
+            return
+        config, _ = self._load_sources()
+        opts = (config.get("performance") or {}).get("snapshots") or {}
+        self.snapshots = SnapshotManager(
+            self.snapshot_dir,
+            durable=bool(opts.get("durable", False)),
+            compress=bool(opts.get("compress", False)),
+        )
 
     async def close(self) -> None:
-        """Close database connection."""
+        """Close database connection and worker pool."""
         if self.db:
             await self.db.close()
+        if self._cpu_pool:
+            self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+            self._cpu_pool = None
 
     async def ingest_all(self, source_ids: Optional[List[str]] = None) -> IngestSummary:
         """Ingest from all enabled sources (or specified subset) concurrently.
@@ -117,40 +318,11 @@ class IngestOrchestrator:
             6. Save snapshots to disk
             7. Update source status
         """
-        if not self.db:
-            await self.initialize()
-        assert self.db is not None
-
-        config = self.load_config()
         summary = IngestSummary()
         t0 = time.monotonic()
 
-        # Step 1: Load sources from config, then filter by DB enabled flag
-        sources = self._get_sources(config, source_ids)
-        disabled_ids = await self.db.get_disabled_source_ids()
-        sources = [s for s in sources if s.id not in disabled_ids]
-        if not sources:
-            logger.warning("No sources to ingest (none enabled or none match filter)")
-            return summary
-
-        # Sync sources to DB (preserves existing enabled flag on update)
-        for source in sources:
-            await self.db.upsert_source(source)
-
-        # Step 2-7: Ingest concurrently with semaphore
-        sem = asyncio.Semaphore(self.max_concurrent)
-        tasks = [
-            self._ingest_source(source, sem)
-            for source in sources
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error("Ingest task failed: %s", result)
-                summary.total_errors += 1
-            elif isinstance(result, IngestResult):
-                summary.add(result)
+        async for result in self.iter_ingest(source_ids, summary=summary):
+            summary.add(result)
 
         summary.duration_seconds = time.monotonic() - t0
         logger.info(
@@ -163,72 +335,196 @@ class IngestOrchestrator:
         )
         return summary
 
+    async def iter_ingest(
+        self,
+        source_ids: Optional[List[str]] = None,
+        *,
+        summary: Optional[IngestSummary] = None,
+    ) -> AsyncIterator[IngestResult]:
+        """Ingest sources concurrently, yielding each result as its source finishes.
+
+        A source's fetch status is committed before its result is yielded;
+        sources that finish together share one transaction.
+        Failures that leave no result (a crashed task, or a source cancelled at
+        the ingest deadline) are counted in ``summary.total_errors`` if given.
+        Closing the iterator early cancels the sources still running.
+        """
+        if not self.db:
+            await self.initialize()
+        assert self.db is not None
+
+        config, all_sources = self._load_sources()
+
+        # Step 1: Load sources from config, sync them to DB (preserves existing
+        # enabled flag on update), then filter by DB enabled flag
+        sources = self._get_sources(all_sources, source_ids)
+        disabled_ids = await self.db.sync_sources_and_get_disabled(sources)
+        sources = [s for s in sources if s.id not in disabled_ids]
+        if not sources:
+            logger.warning("No sources to ingest (none enabled or none match filter)")
+            return
+
+        # Step 2-7: Ingest concurrently, bounded globally and per host so a
+        # slow host cannot occupy every slot and starve the fast ones, with
+        # fetch starts to one host spaced out (politeness / rate limits)
+        perf = config.get("performance") or {}
+        global_sem = asyncio.Semaphore(
+            self.max_concurrent
+            or perf.get("max_concurrent_sources")
+            or DEFAULT_MAX_CONCURRENT
+        )
+        host_sems: DefaultDict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.max_per_host)
+        )
+        rate_limiter = HostRateLimiter(
+            perf.get("min_host_interval_seconds", DEFAULT_MIN_HOST_INTERVAL)
+        )
+        loop = asyncio.get_running_loop()
+        deadline = (
+            None if self.ingest_deadline is None else loop.time() + self.ingest_deadline
+        )
+        pending = {
+            asyncio.create_task(
+                self._ingest_source(
+                    source, global_sem, host_sems[_source_host(source)], rate_limiter
+                )
+            )
+            for source in sources
+        }
+
+        # Yield results as sources finish so fast sources are reported (and
+        # released) without waiting for the slowest one. The deadline is
+        # checked around each wait rather than with asyncio.timeout(), which
+        # would also cancel the consumer's code between yields.
+        done_count = 0
+        try:
+            while pending:
+                timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                results = []
+                for task in done:
+                    done_count += 1
+                    try:
+                        results.append(task.result())
+                    except Exception as e:
+                        logger.error("Ingest task failed: %s", e)
+                        if summary is not None:
+                            summary.total_errors += 1
+
+                # One status transaction for the sources that finished together,
+                # committed before their results are handed out
+                fetched_at = datetime.utcnow()
+                await self.db.update_source_statuses(
+                    [
+                        (r.source_id, fetched_at, r.error_message, not r.success)
+                        for r in results
+                    ]
+                )
+                logger.debug("Ingest progress: %d/%d sources done", done_count, len(sources))
+                for result in results:
+                    yield result
+
+            if pending:
+                if summary is not None:
+                    summary.total_errors += len(pending)
+                logger.warning(
+                    "Ingest deadline of %.0fs reached; cancelled %d source(s)",
+                    self.ingest_deadline, len(pending),
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def _ingest_source(
-        self, source: Source, sem: asyncio.Semaphore
+        self,
+        source: Source,
+        global_sem: asyncio.Semaphore,
+        host_sem: asyncio.Semaphore,
+        rate_limiter: HostRateLimiter,
     ) -> IngestResult:
-        """Ingest a single source with semaphore-based concurrency control."""
+        """Ingest a single source with per-host and global concurrency control."""
         assert self.db is not None
         result = IngestResult(source_id=source.id)
         t0 = time.monotonic()
 
-        async with sem:
-            try:
-                # Fetch raw items
-                raw_items = await self._fetch_source(source)
-                result.fetched = len(raw_items)
-
-                if not raw_items:
-                    await self.db.update_source_status(
-                        source.id, last_fetch_at=datetime.utcnow()
-                    )
-                    result.duration_seconds = time.monotonic() - t0
-                    return result
-
-                # Normalize to Item objects
-                items = self._normalize_items(raw_items, source)
-
-                # Deduplicate by canonical URL
-                items, dups = await self._deduplicate(items)
-                result.duplicates = dups
-
-                # Batch insert
-                inserted = await self.db.batch_insert_items(items)
-                result.inserted = inserted
-
-                # Save snapshots for items that have content
-                for item in items:
-                    if item.content:
-                        try:
-                            path = self.snapshots.save(
-                                source.id, item.url, item.content
-                            )
-                            item.snapshot_path = path
-                        except Exception as e:
-                            logger.warning("Snapshot save failed for %s: %s", item.url, e)
-
-                # Update source status
-                await self.db.update_source_status(
-                    source.id, last_fetch_at=datetime.utcnow()
-                )
+        # Host slot (and host spacing) first: waiting on a busy or rate-limited
+        # host must not hold a global slot
+        async with host_sem:
+            await rate_limiter.wait(_source_host(source))
+            async with global_sem:
+                try:
+                    # Fetch raw items
+                    raw_items = await self._fetch_source(source)
+                    result.fetched = len(raw_items)
+
+                    if raw_items:
+                        # Normalize to Item objects
+                        items = self._normalize_items(raw_items, source)
+
+                        # Deduplicate by canonical URL
+                        items, dups = await self._deduplicate(items)
+                        result.duplicates = dups
+
+                        # Batch insert
+                        inserted = await self.db.insert_items_bulk(items)
+                        result.inserted = inserted
+
+                        # Save snapshots for items that have content
+                        await self._save_snapshots(source, items)
+
+                        logger.info(
+                            "Source %s: fetched=%d, inserted=%d, dups=%d",
+                            source.id, result.fetched, result.inserted, result.duplicates,
+                        )
+
+                except Exception as e:
+                    result.error_message = str(e)
+                    result.errors = 1
+                    logger.error("Source %s failed: %s", source.id, e)
 
-                logger.info(
-                    "Source %s: fetched=%d, inserted=%d, dups=%d",
-                    source.id, result.fetched, result.inserted, result.duplicates,
-                )
+        result.duration_seconds = time.monotonic() - t0
+        return result
 
-            except Exception as e:
-                result.error_message = str(e)
-                result.errors = 1
-                logger.error("Source %s failed: %s", source.id, e)
-                await self.db.update_source_status(
-                    source.id,
-                    last_fetch_at=datetime.utcnow(),
-                    last_error=str(e),
-                    increment_errors=True,
+    async def _save_snapshots(self, source: Source, items: List[Item]) -> None:
+        """Write snapshots concurrently, then record their paths in one DB write."""
+        assert self.db is not None
+        with_content = [item for item in items if item.content]
+        if not with_content:
+            return
+
+        url_hashes = await self._hash_urls([item.url for item in with_content])
+        now = datetime.utcnow()
+        paths = await asyncio.gather(
+            *(
+                self.snapshots.save(
+                    source.id, item.url, item.content, url_hash, now
                 )
+                for item, url_hash in zip(with_content, url_hashes)
+            ),
+            return_exceptions=True,
+        )
+        await self.snapshots.flush()
 
-        result.duration_seconds = time.monotonic() - t0
-        return result
+        updates = []
+        for item, path in zip(with_content, paths):
+            if isinstance(path, BaseException):
+                logger.warning("Snapshot save failed for %s: %s", item.url, path)
+                continue
+            item.snapshot_path = path
+            updates.append((item.id, path))
+        await self.db.batch_update_snapshot_paths(updates)
+
+    async def _hash_urls(self, urls: List[str]) -> List[str]:
+        """Compute snapshot URL hashes, offloading large batches to the CPU pool."""
+        if self._cpu_pool is None or len(urls) < CPU_POOL_THRESHOLD:
+            return _hash_urls_batch(urls)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cpu_pool, _hash_urls_batch, urls)
 
     async def _fetch_source(self, source: Source) -> List[Dict[str, Any]]:
         """Fetch items from a source using its connector."""
@@ -256,32 +552,36 @@ class IngestOrchestrator:
         """Convert raw dicts to Item objects with canonical URLs."""
         items = []
         now = datetime.utcnow()
+        # Per-source values and hot callables are bound once per batch
+        source_id = source.id
+        category = source.config.get("category", "news")
+        language = source.config.get("lang", "en")
+        canonicalize = Item.canonicalize_url
+        make_id = Item.make_id
+        append = items.append
 
         for raw in raw_items:
             url = raw.get("url", "")
             if not url:
                 continue
 
-            canonical = Item.canonicalize_url(url)
-            item_id = Item.make_id(url, source.id)
-
             try:
-                item = Item(
-                    id=item_id,
-                    source_id=source.id,
-                    external_id=raw.get("external_id"),
+                get = raw.get
+                append(Item(
+                    id=make_id(url, source_id),
+                    source_id=source_id,
+                    external_id=get("external_id"),
                     url=url,
-                    url_canonical=canonical,
-                    title=raw.get("title", "Untitled"),
-                    content=raw.get("content"),
-                    author=raw.get("author"),
-                    published_at=_parse_datetime(raw.get("published_at")) or now,
+                    url_canonical=canonicalize(url),
+                    title=get("title", "Untitled"),
+                    content=get("content"),
+                    author=get("author"),
+                    published_at=_parse_datetime(get("published_at")) or now,
                     ingested_at=now,
-                    category=source.config.get("category", "news"),
-                    language=source.config.get("lang", "en"),
-                    metadata=raw.get("metadata"),
-                )
-                items.append(item)
+                    category=category,
+                    language=language,
+                    metadata=get("metadata"),
+                ))
             except Exception as e:
                 logger.warning("Failed to normalize item %s: %s", url, e)
 
@@ -293,7 +593,8 @@ class IngestOrchestrator:
         Returns (unique_items, duplicate_count).
         """
         assert self.db is not None
-        seen: set = set()
+        # One bulk lookup for canonical URLs already in the DB
+        seen = await self.db.url_canonicals_exist([item.url_canonical for item in items])
         unique = []
         dups = 0
 
@@ -301,13 +602,6 @@ class IngestOrchestrator:
             if item.url_canonical in seen:
                 dups += 1
                 continue
-
-            # Check DB for existing canonical URL
-            if await self.db.url_canonical_exists(item.url_canonical):
-                dups += 1
-                seen.add(item.url_canonical)
-                continue
-
             seen.add(item.url_canonical)
             unique.append(item)
 
@@ -315,17 +609,33 @@ class IngestOrchestrator:
 
     def _get_sources(
         self,
-        config: Dict[str, Any],
+        sources: Tuple[Source, ...],
         source_ids: Optional[List[str]] = None,
     ) -> List[Source]:
-        """Build Source objects from config, optionally filtering by ID."""
-        sources = []
-        for cfg in config.get("sources", []):
-            source = Source.from_config(cfg)
-            if source_ids and source.id not in source_ids:
-                continue
-            sources.append(source)
-        return sources
+        """Return the configured sources, optionally filtered by ID."""
+        if not source_ids:
+            return list(sources)
+        allowed = frozenset(source_ids)
+        return [s for s in sources if s.id in allowed]
+
+
+# macOS has no fdatasync; fsync is the equivalent there
+_fdatasync: Callable[[int], None] = getattr(os, "fdatasync", os.fsync)
+
+
+def _url_hash(url: str) -> str:
+    """Short stable hash used as the snapshot file name (and shard) for a URL."""
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _hash_urls_batch(urls: List[str]) -> List[str]:
+    """Hash a batch of URLs (module-level so it can run in a worker process)."""
+    return [_url_hash(url) for url in urls]
+
+
+def _source_host(source: Source) -> str:
+    """Return the network location a source fetches from (empty if unknown)."""
+    return urlparse(source.config.get("url", "")).netloc.lower()
 
 
 def _parse_datetime(val: Any) -> Optional[datetime]:
@@ -334,8 +644,13 @@ def _parse_datetime(val: Any) -> Optional[datetime]:
         return None
     if isinstance(val, datetime):
         return val
+    # Fast path: most connectors emit ISO-8601, which needs no dateutil
+    try:
+        return datetime.fromisoformat(str(val))
+    except ValueError:
+        pass
     try:
         from dateutil.parser import parse
         return parse(str(val))
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, OverflowError):
         return None
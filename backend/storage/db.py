@@ -3,14 +3,33 @@
 from __future__ import annotations
 
 import asyncio
+import calendar
+import copy
+import itertools
 import json
 import logging
+import os
 import sqlite3
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 import aiosqlite
 
@@ -19,8 +38,108 @@ from backend.storage.migrations import apply_migrations
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 DEFAULT_BATCH_SIZE = 1000
 DEFAULT_SEARCH_LIMIT = 50
+# Filtered searches rank this many times (limit + offset) FTS matches before filtering
+SEARCH_OVERSAMPLE = 10
+# Default cap on read-only connections (WAL readers) used to run independent
+# queries concurrently
+READ_POOL_SIZE = 4
+# Inserts of at least this many rows are followed by PRAGMA optimize, so
+# planner statistics track the table right after big loads
+OPTIMIZE_AFTER_ROWS = 1000
+# Prepared statements kept per connection (sqlite3 default: 128). Filtered
+# search/listing queries vary in shape, so the default can churn.
+STATEMENT_CACHE_SIZE = 512
+# Rows fetched per executor hop when streaming (_iter_read)
+READ_CHUNK_SIZE = 256
+STATS_TTL_SECONDS = 60.0
+# Search results are reused while no write has been committed, within the TTL
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL_SECONDS = 30.0
+# Source configs change rarely; other processes' edits show up within this TTL
+SOURCES_TTL_SECONDS = 30.0
+# Keys per IN (...) lookup; well below SQLite's bound-parameter limit
+EXISTS_CHUNK_SIZE = 500
+
+# Kept as constants (never f-strings) so sqlite3's statement cache reuses them
+UPSERT_SOURCE_SQL = """INSERT INTO sources (id, config, last_fetch_at, last_error, error_count, enabled)
+   VALUES (?, ?, ?, ?, ?, ?)
+   ON CONFLICT(id) DO UPDATE SET
+       config=excluded.config,
+       last_fetch_at=excluded.last_fetch_at,
+       last_error=excluded.last_error,
+       error_count=excluded.error_count"""
+
+SOURCE_OK_SQL = """UPDATE sources
+   SET last_fetch_at = ?, last_error = NULL, error_count = 0
+   WHERE id = ?"""
+SOURCE_ERROR_SQL = """UPDATE sources SET last_error = ?, last_fetch_at = ?
+   WHERE id = ?"""
+SOURCE_ERROR_INCREMENT_SQL = """UPDATE sources
+   SET last_error = ?, error_count = error_count + 1,
+       last_fetch_at = COALESCE(?, last_fetch_at)
+   WHERE id = ?"""
+
+INSERT_ITEM_SQL = """INSERT OR IGNORE INTO items
+   (id, source_id, external_id, url, url_canonical, title, content,
+    author, published_at, ingested_at, category, language, metadata,
+    snapshot_path)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Multi-row form of INSERT_ITEM_SQL: one statement step per BULK_INSERT_ROWS
+# items. Sized for SQLite's historical 999 bound-parameter default so it also
+# works on builds with the old limit.
+ITEM_COLUMN_COUNT = 14
+BULK_INSERT_ROWS = 999 // ITEM_COLUMN_COUNT
+INSERT_ITEMS_BULK_SQL = INSERT_ITEM_SQL.rsplit("VALUES", 1)[0] + "VALUES " + ", ".join(
+    ["(" + ", ".join("?" * ITEM_COLUMN_COUNT) + ")"] * BULK_INSERT_ROWS
+)
+
+# The items -> items_fts insert trigger from schema.sql; bulk_mode() drops it
+# for the duration of a load and recreates it with this exact definition
+ITEMS_FTS_INSERT_TRIGGER_SQL = """CREATE TRIGGER IF NOT EXISTS items_ai AFTER INSERT ON items BEGIN
+    INSERT INTO items_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content);
+END"""
+
+# Only the columns the Item/Metric decoders read, instead of i.* / m.*
+TOP_ITEMS_COLUMNS = ", ".join(
+    [
+        f"i.{c}"
+        for c in (
+            "id", "source_id", "external_id", "url", "url_canonical", "title",
+            "content", "author", "published_at", "ingested_at", "category",
+            "language", "metadata", "snapshot_path",
+        )
+    ]
+    + [
+        f"m.{c}"
+        for c in (
+            "item_id", "score", "score_authority", "score_recency",
+            "score_popularity", "score_relevance", "dup_penalty", "cluster_id",
+            "summary_json", "computed_at",
+        )
+    ]
+)
+
+# Native UPSERT updates the row in place; INSERT OR REPLACE deletes and
+# re-inserts it, doubling the WAL frames written per metric
+UPSERT_METRICS_SQL = """INSERT INTO metrics
+   (item_id, score, score_authority, score_recency, score_popularity,
+    score_relevance, dup_penalty, cluster_id, summary_json, computed_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+   ON CONFLICT(item_id) DO UPDATE SET
+       score=excluded.score,
+       score_authority=excluded.score_authority,
+       score_recency=excluded.score_recency,
+       score_popularity=excluded.score_popularity,
+       score_relevance=excluded.score_relevance,
+       dup_penalty=excluded.dup_penalty,
+       cluster_id=excluded.cluster_id,
+       summary_json=excluded.summary_json,
+       computed_at=excluded.computed_at"""
 
 
 class DatabaseManager:
@@ -35,43 +154,218 @@ class DatabaseManager:
 
     def __init__(
         self,
-        db_path: str,
+        db_path: str | os.PathLike[str],
         batch_size: int = DEFAULT_BATCH_SIZE,
         cache_size_mb: int = 64,
+        read_pool_size: int = READ_POOL_SIZE,
     ):
-        self.db_path = db_path
+        if read_pool_size < 1:
+            raise ValueError("read_pool_size must be at least 1")
+        self.db_path = os.fspath(db_path)
         self.batch_size = batch_size
         self.cache_size_mb = cache_size_mb
+        self.read_pool_size = read_pool_size
         self._conn: Optional[aiosqlite.Connection] = None
+        # Read pool: plain sqlite3 connections checked out via _read_idle and
+        # driven on _read_executor threads. One is opened by initialize(); more
+        # are opened on demand, up to read_pool_size, when all are busy.
+        self._read_conns: List[sqlite3.Connection] = []
+        self._read_opening = 0
+        # Streams (_iter_read) stay open across yields, so each runs on its own
+        # connection outside the pool: a consumer awaiting pool reads inside
+        # the loop never waits on its own stream. Finished streams park their
+        # connection here for the next one.
+        self._stream_idle: List[sqlite3.Connection] = []
+        # Built once: resolving the path and URI-quoting it are not free, and
+        # every pooled reader connects with the same URI
+        self._read_uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        self._read_pragmas: Tuple[str, ...] = ()
+        self._read_idle: Optional[asyncio.Queue[sqlite3.Connection]] = None
+        self._read_executor: Optional[ThreadPoolExecutor] = None
+        # One lock for all writers: every write shares the single writer
+        # connection, which can only hold one transaction at a time, and
+        # SQLite serializes writers on the file anyway. Keep work that does
+        # not touch the connection outside _transaction() instead.
         self._write_lock = asyncio.Lock()
+        # Bumped on every committed write; keys the in-process read caches
+        self._write_generation = 0
+        self._stats_cache: Optional[Tuple[int, float, Dict[str, Any]]] = None
+        # LRU of search key -> (write generation, monotonic time, results or count)
+        self._search_cache: OrderedDict[tuple, Tuple[int, float, Any]] = OrderedDict()
+        # (monotonic time, sources); cleared by every source write in this process
+        self._sources_cache: Optional[Tuple[float, List[Source]]] = None
 
     async def initialize(self) -> None:
         """Create database, apply migrations, and configure pragmas."""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        # Apply migrations synchronously (schema changes)
-        apply_migrations(self.db_path)
+        # Apply migrations on a worker thread; sqlite3 DDL would block the loop
+        await asyncio.to_thread(apply_migrations, self.db_path)
 
         # Open async connection
-        self._conn = await aiosqlite.connect(self.db_path)
+        self._conn = await aiosqlite.connect(
+            self.db_path, cached_statements=STATEMENT_CACHE_SIZE
+        )
         self._conn.row_factory = aiosqlite.Row
 
-        # Performance pragmas
-        await self._conn.execute("PRAGMA journal_mode=WAL")
-        await self._conn.execute(f"PRAGMA cache_size=-{self.cache_size_mb * 1000}")
-        await self._conn.execute("PRAGMA synchronous=NORMAL")
-        await self._conn.execute("PRAGMA temp_store=MEMORY")
-        await self._conn.execute("PRAGMA foreign_keys=ON")
-        await self._conn.execute("PRAGMA mmap_size=268435456")  # 256MB mmap
+        # Performance pragmas: WAL + synchronous=NORMAL means one WAL append per
+        # committed transaction rather than an fsync per statement
+        cache_pragmas = (
+            f"PRAGMA cache_size=-{self.cache_size_mb * 1000}",
+            "PRAGMA temp_store=MEMORY",
+            "PRAGMA mmap_size=268435456",  # 256MB mmap
+            # Wait on locks held by other processes (CLI, scheduler) instead
+            # of failing immediately with SQLITE_BUSY
+            "PRAGMA busy_timeout=5000",
+        )
+        await _apply_pragmas(
+            self._conn,
+            (
+                "PRAGMA journal_mode=WAL",
+                "PRAGMA synchronous=NORMAL",
+                "PRAGMA foreign_keys=ON",
+                # Checkpoint every ~10k pages instead of 1k so large ingest runs
+                # are not interrupted by frequent WAL checkpoints
+                "PRAGMA wal_autocheckpoint=10000",
+                # Truncate the WAL back to 64MB after checkpoints following bursts
+                "PRAGMA journal_size_limit=67108864",
+                *cache_pragmas,
+            ),
+        )
+
+        # A bulk load that died inside bulk_mode() leaves the FTS insert
+        # trigger dropped; restore it and reindex what was loaded meanwhile
+        cursor = await self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'items_ai'"
+        )
+        if await cursor.fetchone() is None:
+            logger.warning("FTS insert trigger missing (interrupted bulk load); rebuilding index")
+            await self._restore_fts_trigger()
+
+        # Read-only pool: WAL lets these read concurrently with each other and
+        # with the writer connection. Plain sqlite3 on a shared thread pool
+        # costs one executor hop per query instead of aiosqlite's round trip
+        # through a dedicated thread for every cursor call.
+        self._read_pragmas = cache_pragmas
+        self._read_executor = ThreadPoolExecutor(
+            max_workers=self.read_pool_size, thread_name_prefix="ainews-read"
+        )
+        self._read_idle = asyncio.Queue()
+        self._read_idle.put_nowait(await self._open_read_conn())
 
         logger.info("Database initialized: %s", self.db_path)
 
     async def close(self) -> None:
-        """Close the database connection."""
+        """Close the database connections."""
+        if self._read_executor is not None:
+            # Waiting for in-flight reads must not block the event loop
+            executor, self._read_executor = self._read_executor, None
+            await asyncio.to_thread(executor.shutdown, True)
+        for conn in self._read_conns + self._stream_idle:
+            conn.close()
+        self._read_conns = []
+        self._stream_idle = []
+        self._read_idle = None
         if self._conn:
+            # Refresh planner statistics for tables whose stats went stale
+            # during this session (SQLite's recommended close-time step)
+            try:
+                async with self._write_lock:
+                    await _apply_pragmas(
+                        self._conn, ("PRAGMA analysis_limit=1000", "PRAGMA optimize")
+                    )
+            except sqlite3.Error:
+                logger.warning("PRAGMA optimize failed on close", exc_info=True)
             await self._conn.close()
             self._conn = None
 
+    async def _on_read_thread(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn(*args) on the read executor.
+
+        If the caller is cancelled, still wait for the worker to finish: it
+        keeps using its connection until fn returns, so the connection must
+        not go back to the pool before then.
+        """
+        assert self._read_executor is not None, "Database not initialized"
+        inner = asyncio.wrap_future(self._read_executor.submit(fn, *args))
+        try:
+            return await asyncio.shield(inner)
+        except asyncio.CancelledError:
+            await asyncio.wait([inner])
+            if not inner.cancelled():
+                inner.exception()  # retrieved; the cancellation wins
+            raise
+
+    @asynccontextmanager
+    async def _read_conn(self) -> AsyncIterator[sqlite3.Connection]:
+        """Check out an idle read-pool connection, growing the pool if all are busy."""
+        assert self._read_idle is not None, "Database not initialized"
+        if (
+            self._read_idle.empty()
+            and len(self._read_conns) + self._read_opening < self.read_pool_size
+        ):
+            conn = await self._open_read_conn()
+        else:
+            conn = await self._read_idle.get()
+        try:
+            yield conn
+        finally:
+            self._read_idle.put_nowait(conn)
+
+    async def _open_read_conn(self) -> sqlite3.Connection:
+        """Open one more read-pool connection and register it with the pool."""
+        self._read_opening += 1
+        try:
+            conn = await self._on_read_thread(_open_reader, self._read_uri, self._read_pragmas)
+        finally:
+            self._read_opening -= 1
+        self._read_conns.append(conn)
+        return conn
+
+    async def _read_query(
+        self, sql: str, params: Sequence[Any] = ()
+    ) -> Tuple[Any, List[Any]]:
+        """Run a read on the pool; returns (cursor description, rows)."""
+        async with self._read_conn() as conn:
+            return await self._on_read_thread(_query, conn, sql, params)
+
+    async def _iter_read(
+        self, sql: str, params: Sequence[Any] = ()
+    ) -> AsyncIterator[Tuple[Any, List[Any]]]:
+        """Stream (cursor description, row chunk) pairs on a stream connection.
+
+        Chunks are READ_CHUNK_SIZE rows, one read-executor hop each. The
+        connection is not one of the pool's, so other reads may be awaited
+        between chunks. It is held until the iterator finishes; consumers that
+        stop early should aclose() it to hand the connection back promptly.
+        """
+        assert self._read_idle is not None, "Database not initialized"
+        if self._stream_idle:
+            conn = self._stream_idle.pop()
+        else:
+            conn = await self._on_read_thread(_open_reader, self._read_uri, self._read_pragmas)
+        try:
+            cursor = await self._on_read_thread(conn.execute, sql, params)
+            try:
+                while rows := await self._on_read_thread(cursor.fetchmany, READ_CHUNK_SIZE):
+                    yield cursor.description, rows
+            finally:
+                await self._on_read_thread(cursor.close)
+        finally:
+            if self._read_idle is not None and len(self._stream_idle) < self.read_pool_size:
+                self._stream_idle.append(conn)
+            else:
+                conn.close()
+
+    async def _iter_read_items(self, sql: str, params: Sequence[Any]) -> AsyncIterator[Item]:
+        """Stream items from a stream connection (see _iter_read)."""
+        decode = None
+        async for description, rows in self._iter_read(sql, params):
+            if decode is None:
+                decode = Item.row_decoder(description)
+            for row in rows:
+                yield decode(row)
+
     @asynccontextmanager
     async def _transaction(self) -> AsyncIterator[aiosqlite.Connection]:
         """Acquire write lock and begin a transaction."""
@@ -81,7 +375,9 @@ class DatabaseManager:
             try:
                 yield self._conn
                 await self._conn.commit()
-            except Exception:
+                self._write_generation += 1
+            except BaseException:
+                # Includes cancellation, which must not leave the transaction open
                 await self._conn.rollback()
                 raise
 
@@ -89,56 +385,66 @@ class DatabaseManager:
 
     async def upsert_source(self, source: Source) -> None:
         """Insert or update a source. On update, preserves existing enabled flag."""
-        assert self._conn is not None
-        async with self._write_lock:
-            await self._conn.execute(
-                """INSERT INTO sources (id, config, last_fetch_at, last_error, error_count, enabled)
-                   VALUES (?, ?, ?, ?, ?, ?)
-                   ON CONFLICT(id) DO UPDATE SET
-                       config=excluded.config,
-                       last_fetch_at=excluded.last_fetch_at,
-                       last_error=excluded.last_error,
-                       error_count=excluded.error_count""",
-                source.to_row(),
-            )
-            await self._conn.commit()
+        async with self._transaction() as conn:
+            await conn.execute(UPSERT_SOURCE_SQL, source.to_row())
+        self._sources_cache = None
+
+    async def sync_sources_and_get_disabled(self, sources: Sequence[Source]) -> Set[str]:
+        """Upsert sources and return the ids of disabled ones, in one transaction.
+
+        Replaces 1 + N round trips (disabled lookup plus one upsert per source)
+        at the start of an ingest run. Disabled sources are not upserted: the
+        upsert resets fetch status, and their error history is usually why
+        they were disabled.
+        """
+        async with self._transaction() as conn:
+            async with conn.execute("SELECT id FROM sources WHERE enabled = 0") as cursor:
+                disabled = {r[0] for r in await cursor.fetchall()}
+            rows = [s.to_row() for s in sources if s.id not in disabled]
+            if rows:
+                await conn.executemany(UPSERT_SOURCE_SQL, rows)
+        self._sources_cache = None
+        return disabled
 
     async def get_source(self, source_id: str) -> Optional[Source]:
         """Get a source by ID."""
-        assert self._conn is not None
-        cursor = await self._conn.execute(
+        description, rows = await self._read_query(
             "SELECT * FROM sources WHERE id = ?", (source_id,)
         )
-        row = await cursor.fetchone()
-        return Source.from_row(dict(row)) if row else None
+        return Source.from_row(_dict_rows(description, rows)[0]) if rows else None
 
     async def get_enabled_sources(self) -> List[Source]:
-        """Get all enabled sources."""
-        assert self._conn is not None
-        cursor = await self._conn.execute(
-            "SELECT * FROM sources WHERE enabled = 1"
-        )
-        rows = await cursor.fetchall()
-        return [Source.from_row(dict(r)) for r in rows]
+        """Get all enabled sources.
+
+        Served from a short-lived cache; callers get copies so they cannot
+        mutate the cached objects.
+        """
+        cached = self._sources_cache
+        if cached is None or time.monotonic() - cached[0] >= SOURCES_TTL_SECONDS:
+            description, rows = await self._read_query(
+                "SELECT * FROM sources WHERE enabled = 1"
+            )
+            cached = (
+                time.monotonic(),
+                [Source.from_row(r) for r in _dict_rows(description, rows)],
+            )
+            self._sources_cache = cached
+        # Sources are frozen, so only the list needs copying
+        return list(cached[1])
 
     async def get_disabled_source_ids(self) -> List[str]:
         """Return source ids that are disabled (enabled = 0)."""
-        assert self._conn is not None
-        cursor = await self._conn.execute(
-            "SELECT id FROM sources WHERE enabled = 0"
-        )
-        rows = await cursor.fetchall()
+        _, rows = await self._read_query("SELECT id FROM sources WHERE enabled = 0")
         return [r[0] for r in rows]
 
     async def update_source_enabled(self, source_id: str, enabled: bool) -> None:
         """Set enabled flag for a source."""
-        assert self._conn is not None
-        async with self._write_lock:
-            await self._conn.execute(
+        async with self._transaction() as conn:
+            await conn.execute(
                 "UPDATE sources SET enabled = ? WHERE id = ?",
                 (1 if enabled else 0, source_id),
             )
-            await self._conn.commit()
+        self._sources_cache = None
 
     async def update_source_status(
         self,
@@ -148,31 +454,25 @@ class DatabaseManager:
         increment_errors: bool = False,
     ) -> None:
         """Update source fetch status."""
-        assert self._conn is not None
-        async with self._write_lock:
-            if last_error:
-                if increment_errors:
-                    await self._conn.execute(
-                        """UPDATE sources
-                           SET last_error = ?, error_count = error_count + 1,
-                               last_fetch_at = COALESCE(?, last_fetch_at)
-                           WHERE id = ?""",
-                        (last_error, last_fetch_at and last_fetch_at.isoformat(), source_id),
-                    )
-                else:
-                    await self._conn.execute(
-                        """UPDATE sources SET last_error = ?, last_fetch_at = ?
-                           WHERE id = ?""",
-                        (last_error, last_fetch_at and last_fetch_at.isoformat(), source_id),
-                    )
-            else:
-                await self._conn.execute(
-                    """UPDATE sources
-                       SET last_fetch_at = ?, last_error = NULL, error_count = 0
-                       WHERE id = ?""",
-                    (last_fetch_at and last_fetch_at.isoformat(), source_id),
-                )
-            await self._conn.commit()
+        await self.update_source_statuses(
+            [(source_id, last_fetch_at, last_error, increment_errors)]
+        )
+
+    async def update_source_statuses(
+        self, updates: Sequence[Tuple[str, Optional[datetime], Optional[str], bool]]
+    ) -> None:
+        """Apply several update_source_status calls in one transaction.
+
+        Each update is ``(source_id, last_fetch_at, last_error, increment_errors)``.
+        Consecutive updates with the same statement share one executemany.
+        """
+        if not updates:
+            return
+        statements = [_source_status_statement(*update) for update in updates]
+        async with self._transaction() as conn:
+            for sql, group in itertools.groupby(statements, key=itemgetter(0)):
+                await conn.executemany(sql, [params for _, params in group])
+        self._sources_cache = None
 
     # --- Items ---
 
@@ -184,45 +484,151 @@ class DatabaseManager:
         inserted = 0
         async with self._transaction() as conn:
             for i in range(0, len(items), self.batch_size):
-                batch = items[i : i + self.batch_size]
-                rows = [item.to_row() for item in batch]
+                # Rows are produced lazily as sqlite3 binds them; no per-batch list
                 cursor = await conn.executemany(
-                    """INSERT OR IGNORE INTO items
-                       (id, source_id, external_id, url, url_canonical, title, content,
-                        author, published_at, ingested_at, category, language, metadata,
-                        snapshot_path)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    rows,
+                    INSERT_ITEM_SQL,
+                    (item.to_row() for item in items[i : i + self.batch_size]),
                 )
                 inserted += cursor.rowcount
 
-        logger.info("Batch insert: %d/%d items inserted", inserted, len(items))
+        await self._optimize_after_bulk(inserted)
+        logger.debug("Batch insert: %d/%d items inserted", inserted, len(items))
+        return inserted
+
+    async def insert_items_bulk(self, items: List[Item]) -> int:
+        """Insert items with multi-row VALUES statements, skipping duplicates.
+
+        See batch_insert_rows. Returns count inserted.
+        """
+        if not items:
+            return 0
+        inserted = await self.batch_insert_rows(item.to_row() for item in items)
+        logger.debug("Bulk insert: %d/%d items inserted", inserted, len(items))
+        return inserted
+
+    async def batch_insert_rows(self, rows: Iterable[Sequence[Any]]) -> int:
+        """Insert pre-built item rows (Item.to_row() layout) in one transaction.
+
+        ``rows`` may be a generator; it is consumed BULK_INSERT_ROWS at a time,
+        so the full set is never materialized. Full chunks use one multi-row
+        statement each; a short final chunk goes through the single-row
+        INSERT_ITEM_SQL with executemany, so only two statement shapes ever
+        reach the statement cache. Duplicates are skipped. Returns count
+        inserted.
+        """
+        it = iter(rows)
+        chunk = list(itertools.islice(it, BULK_INSERT_ROWS))
+        if not chunk:
+            return 0
+
+        inserted = 0
+        async with self._transaction() as conn:
+            while chunk:
+                if len(chunk) == BULK_INSERT_ROWS:
+                    params = [v for row in chunk for v in row]
+                    cursor = await conn.execute(INSERT_ITEMS_BULK_SQL, params)
+                else:
+                    cursor = await conn.executemany(INSERT_ITEM_SQL, chunk)
+                inserted += cursor.rowcount
+                chunk = list(itertools.islice(it, BULK_INSERT_ROWS))
+
+        await self._optimize_after_bulk(inserted)
         return inserted
 
+    async def _optimize_after_bulk(self, inserted: int) -> None:
+        """Let SQLite refresh stale statistics after a large insert (cheap otherwise)."""
+        if inserted < OPTIMIZE_AFTER_ROWS:
+            return
+        assert self._conn is not None
+        async with self._write_lock:
+            await _apply_pragmas(
+                self._conn, ("PRAGMA analysis_limit=1000", "PRAGMA optimize")
+            )
+
+    @asynccontextmanager
+    async def bulk_mode(self) -> AsyncIterator[None]:
+        """Load many items without per-row FTS indexing.
+
+        The items -> items_fts insert trigger is dropped for the block and the
+        index is rebuilt once on exit, which beats tokenizing row by row
+        inside the write transactions for large loads (the rebuild covers the
+        whole table, so it does not pay off for small ones). Searches during
+        the block do not see the new rows. If the process dies mid-block,
+        initialize() restores the trigger and rebuilds.
+        """
+        async with self._transaction() as conn:
+            await conn.execute("DROP TRIGGER IF EXISTS items_ai")
+        try:
+            yield
+        finally:
+            await self._restore_fts_trigger()
+
+    async def _restore_fts_trigger(self) -> None:
+        async with self._transaction() as conn:
+            await conn.execute(ITEMS_FTS_INSERT_TRIGGER_SQL)
+            await conn.execute("INSERT INTO items_fts(items_fts) VALUES('rebuild')")
+
+    async def batch_update_snapshot_paths(self, paths: List[Tuple[str, str]]) -> None:
+        """Record snapshot paths for many items in one transaction.
+
+        Takes ``(item_id, snapshot_path)`` pairs.
+        """
+        if not paths:
+            return
+
+        async with self._transaction() as conn:
+            await conn.executemany(
+                "UPDATE items SET snapshot_path = ? WHERE id = ?",
+                [(path, item_id) for item_id, path in paths],
+            )
+
     async def get_item(self, item_id: str) -> Optional[Item]:
         """Get an item by ID."""
-        assert self._conn is not None
-        cursor = await self._conn.execute(
+        description, rows = await self._read_query(
             "SELECT * FROM items WHERE id = ?", (item_id,)
         )
-        row = await cursor.fetchone()
-        return Item.from_row(dict(row)) if row else None
+        return Item.row_decoder(description)(rows[0]) if rows else None
 
-    async def get_items_by_source(
+    async def iter_items_by_source(
         self,
         source_id: str,
         limit: int = 100,
         offset: int = 0,
-    ) -> List[Item]:
-        """Get items from a specific source, ordered by published_at DESC."""
-        assert self._conn is not None
-        cursor = await self._conn.execute(
+    ) -> AsyncIterator[Item]:
+        """Stream items from a specific source, ordered by published_at DESC."""
+        async for item in self._iter_read_items(
             """SELECT * FROM items WHERE source_id = ?
                ORDER BY published_at DESC LIMIT ? OFFSET ?""",
             (source_id, limit, offset),
-        )
-        rows = await cursor.fetchall()
-        return [Item.from_row(dict(r)) for r in rows]
+        ):
+            yield item
+
+    async def get_items_by_source(
+        self,
+        source_id: str,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Item]:
+        """Get items from a specific source, ordered by published_at DESC."""
+        return [item async for item in self.iter_items_by_source(source_id, limit, offset)]
+
+    async def iter_items_by_category(
+        self,
+        category: str,
+        since: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> AsyncIterator[Item]:
+        """Stream items by category, optionally filtered by date."""
+        if since:
+            sql = """SELECT * FROM items WHERE category = ? AND published_ts >= ?
+                     ORDER BY published_ts DESC LIMIT ?"""
+            params: tuple = (category, _epoch(since), limit)
+        else:
+            sql = """SELECT * FROM items WHERE category = ?
+                     ORDER BY published_ts DESC LIMIT ?"""
+            params = (category, limit)
+        async for item in self._iter_read_items(sql, params):
+            yield item
 
     async def get_items_by_category(
         self,
@@ -231,64 +637,65 @@ class DatabaseManager:
         limit: int = 100,
     ) -> List[Item]:
         """Get items by category, optionally filtered by date."""
-        assert self._conn is not None
-        if since:
-            cursor = await self._conn.execute(
-                """SELECT * FROM items WHERE category = ? AND published_at >= ?
-                   ORDER BY published_at DESC LIMIT ?""",
-                (category, since.isoformat(), limit),
-            )
-        else:
-            cursor = await self._conn.execute(
-                """SELECT * FROM items WHERE category = ?
-                   ORDER BY published_at DESC LIMIT ?""",
-                (category, limit),
-            )
-        rows = await cursor.fetchall()
-        return [Item.from_row(dict(r)) for r in rows]
+        return [item async for item in self.iter_items_by_category(category, since, limit)]
 
     async def item_exists(self, item_id: str) -> bool:
         """Check if an item already exists."""
-        assert self._conn is not None
-        cursor = await self._conn.execute(
-            "SELECT 1 FROM items WHERE id = ?", (item_id,)
-        )
-        return await cursor.fetchone() is not None
+        _, rows = await self._read_query("SELECT 1 FROM items WHERE id = ?", (item_id,))
+        return bool(rows)
 
     async def url_canonical_exists(self, url_canonical: str) -> bool:
         """Check if a canonical URL already exists (cross-source dedup)."""
-        assert self._conn is not None
-        cursor = await self._conn.execute(
+        _, rows = await self._read_query(
             "SELECT 1 FROM items WHERE url_canonical = ?", (url_canonical,)
         )
-        return await cursor.fetchone() is not None
+        return bool(rows)
+
+    async def items_exist(self, ids: Sequence[str]) -> Set[str]:
+        """Return the subset of item ids that already exist."""
+        return await self._existing_item_values("id", ids)
+
+    async def url_canonicals_exist(self, urls: Sequence[str]) -> Set[str]:
+        """Return the subset of canonical URLs that already exist (cross-source dedup)."""
+        return await self._existing_item_values("url_canonical", urls)
+
+    async def _existing_item_values(self, column: str, values: Sequence[str]) -> Set[str]:
+        """Bulk membership check on an indexed items column, chunked IN queries."""
+        unique = list(dict.fromkeys(values))
+        found: Set[str] = set()
+        for i in range(0, len(unique), EXISTS_CHUNK_SIZE):
+            chunk = unique[i : i + EXISTS_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            _, rows = await self._read_query(
+                f"SELECT {column} FROM items WHERE {column} IN ({placeholders})", chunk
+            )
+            found.update(r[0] for r in rows)
+        return found
 
     async def count_items(self, source_id: Optional[str] = None) -> int:
         """Count items, optionally filtered by source."""
-        assert self._conn is not None
         if source_id:
-            cursor = await self._conn.execute(
+            _, rows = await self._read_query(
                 "SELECT COUNT(*) FROM items WHERE source_id = ?", (source_id,)
             )
         else:
-            cursor = await self._conn.execute("SELECT COUNT(*) FROM items")
-        row = await cursor.fetchone()
-        return row[0] if row else 0
+            _, rows = await self._read_query("SELECT COUNT(*) FROM items")
+        return rows[0][0] if rows else 0
 
     async def get_items_for_date(self, date_str: str, limit: int = 5000) -> List[Item]:
         """Load items whose published_at date equals date_str (YYYY-MM-DD)."""
-        assert self._conn is not None
-        cursor = await self._conn.execute(
-            """SELECT * FROM items WHERE date(published_at) = ?
-               ORDER BY published_at DESC LIMIT ?""",
-            (date_str, limit),
-        )
-        rows = await cursor.fetchall()
-        return [Item.from_row(dict(r)) for r in rows]
+        return [
+            item
+            async for item in self._iter_read_items(
+                """SELECT * FROM items WHERE date(published_at) = ?
+                   ORDER BY published_at DESC LIMIT ?""",
+                (date_str, limit),
+            )
+        ]
 
     # --- Search ---
 
-    async def search(
+    async def iter_search(
         self,
         query: str,
         category: Optional[str] = None,
@@ -297,61 +704,137 @@ class DatabaseManager:
         since: Optional[datetime] = None,
         limit: int = DEFAULT_SEARCH_LIMIT,
         offset: int = 0,
-    ) -> List[Item]:
-        """Full-text search with optional filters. Uses FTS5 BM25 ranking."""
+    ) -> AsyncIterator[Item]:
+        """Stream full-text search results in rank order (uncached, read pool)."""
         assert self._conn is not None
 
-        # Build the query using FTS5 MATCH with joins for filtering
-        conditions = []
-        params: list = []
-
-        # FTS match
-        conditions.append("items_fts MATCH ?")
-        params.append(query)
-
         # Optional filters on the items table
+        conditions = []
+        filter_params: list = []
         if category:
             conditions.append("i.category = ?")
-            params.append(category)
+            filter_params.append(category)
         if language:
             conditions.append("i.language = ?")
-            params.append(language)
+            filter_params.append(language)
         if source_id:
             conditions.append("i.source_id = ?")
-            params.append(source_id)
+            filter_params.append(source_id)
         if since:
-            conditions.append("i.published_at >= ?")
-            params.append(since.isoformat())
-
-        where = " AND ".join(conditions)
-        params.extend([limit, offset])
-
+            conditions.append("i.published_ts >= ?")
+            filter_params.append(_epoch(since))
+
+        # Rank inside the FTS table first so FTS5 can use its top-k path for
+        # ORDER BY rank LIMIT k (rank is configured as bm25(1.0, 0.5) by
+        # migration v5), then join back to items. With filters the FTS side is
+        # oversampled so enough rows survive; mixing MATCH with filters on the
+        # joined table can also make the planner abandon the FTS index.
+        top_k = limit + offset
+        where = ""
+        if conditions:
+            top_k *= SEARCH_OVERSAMPLE
+            where = "WHERE " + " AND ".join(conditions)
         sql = f"""
-            SELECT i.*, bm25(items_fts, 1.0, 0.5) AS rank
-            FROM items_fts
-            JOIN items i ON i.rowid = items_fts.rowid
-            WHERE {where}
-            ORDER BY rank
+            WITH fts_matches AS (
+                SELECT rowid, rank
+                FROM items_fts
+                WHERE items_fts MATCH ?
+                ORDER BY rank
+                LIMIT ?
+            )
+            SELECT i.*, fm.rank
+            FROM fts_matches fm
+            JOIN items i ON i.rowid = fm.rowid
+            {where}
+            ORDER BY fm.rank
             LIMIT ? OFFSET ?
         """
+        params = [query, top_k, *filter_params, limit, offset]
+
+        async for item in self._iter_read_items(sql, params):
+            yield item
+
+    async def search(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        language: Optional[str] = None,
+        source_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> List[Item]:
+        """Full-text search with optional filters. Uses FTS5 BM25 ranking.
+
+        Runs on the read pool so searches do not queue behind writes. Repeated
+        searches are answered from an LRU cache until the next committed write
+        or SEARCH_CACHE_TTL_SECONDS, whichever comes first.
+        """
+        assert self._conn is not None
+
+        generation = self._write_generation
+        cache_key = (
+            " ".join(query.split()),
+            category,
+            language,
+            source_id,
+            since.isoformat() if since else None,
+            limit,
+            offset,
+        )
+        cached = self._search_cache_get(cache_key, generation)
+        if cached is not None:
+            return [copy.copy(item) for item in cached]
 
         t0 = time.monotonic()
-        cursor = await self._conn.execute(sql, params)
-        rows = await cursor.fetchall()
+        results = [
+            item
+            async for item in self.iter_search(
+                query, category, language, source_id, since, limit, offset
+            )
+        ]
         elapsed = time.monotonic() - t0
 
-        logger.debug("FTS search for %r: %d results in %.3fs", query, len(rows), elapsed)
-        return [Item.from_row(dict(r)) for r in rows]
+        logger.debug("FTS search for %r: %d results in %.3fs", query, len(results), elapsed)
+        self._search_cache_put(cache_key, generation, results)
+        return [copy.copy(item) for item in results]
 
     async def search_count(self, query: str) -> int:
-        """Count total FTS results for a query (for pagination)."""
-        assert self._conn is not None
-        cursor = await self._conn.execute(
-            "SELECT COUNT(*) FROM items_fts WHERE items_fts MATCH ?",
-            (query,),
+        """Count total FTS results for a query (for pagination).
+
+        Shares the search LRU cache and its invalidation.
+        """
+        generation = self._write_generation
+        cache_key = ("count", " ".join(query.split()))
+        cached = self._search_cache_get(cache_key, generation)
+        if cached is not None:
+            return cached
+        _, rows = await self._read_query(
+            "SELECT COUNT(*) FROM items_fts WHERE items_fts MATCH ?", (query,)
         )
-        row = await cursor.fetchone()
-        return row[0] if row else 0
+        count = rows[0][0] if rows else 0
+        self._search_cache_put(cache_key, generation, count)
+        return count
+
+    def _search_cache_get(self, key: tuple, generation: int) -> Any:
+        """Return a cached search value still valid for this generation, else None."""
+        cached = self._search_cache.get(key)
+        if (
+            cached is not None
+            and cached[0] == generation
+            and time.monotonic() - cached[1] < SEARCH_CACHE_TTL_SECONDS
+        ):
+            self._search_cache.move_to_end(key)
+            return cached[2]
+        return None
+
+    def _search_cache_put(self, key: tuple, generation: int, value: Any) -> None:
+        # generation is the one read before the query ran, so a write that
+        # commits meanwhile leaves this entry already stale
+        self._search_cache[key] = (generation, time.monotonic(), value)
+        self._search_cache.move_to_end(key)
+        if len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
 
     # --- Favorites ---
 
@@ -359,31 +842,27 @@ class DatabaseManager:
         self, item_id: Optional[str] = None
     ) -> List[str]:
         """Return favorite item_ids that have no summary yet. If item_id is set, return at most that one."""
-        assert self._conn is not None
         try:
             if item_id:
-                cursor = await self._conn.execute(
+                _, rows = await self._read_query(
                     "SELECT item_id FROM favorites WHERE item_id = ? AND (summary IS NULL OR summary = '')",
                     (item_id,),
                 )
             else:
-                cursor = await self._conn.execute(
+                _, rows = await self._read_query(
                     "SELECT item_id FROM favorites WHERE summary IS NULL OR summary = ''"
                 )
-            rows = await cursor.fetchall()
             return [r[0] for r in rows]
         except Exception:
             return []
 
     async def update_favorite_summary(self, item_id: str, summary: str) -> None:
         """Set the summary for a favorite."""
-        assert self._conn is not None
-        async with self._write_lock:
-            await self._conn.execute(
+        async with self._transaction() as conn:
+            await conn.execute(
                 "UPDATE favorites SET summary = ? WHERE item_id = ?",
                 (summary, item_id),
             )
-            await self._conn.commit()
 
     # --- Metrics ---
 
@@ -392,17 +871,14 @@ class DatabaseManager:
         if not metrics:
             return 0
 
+        # Rows (summary_json serialization included) are built before taking
+        # the write lock, so this overlaps with another writer's executemany
+        rows = [m.to_row() for m in metrics]
         inserted = 0
         async with self._transaction() as conn:
-            for i in range(0, len(metrics), self.batch_size):
-                batch = metrics[i : i + self.batch_size]
-                rows = [m.to_row() for m in batch]
+            for i in range(0, len(rows), self.batch_size):
                 cursor = await conn.executemany(
-                    """INSERT OR REPLACE INTO metrics
-                       (item_id, score, score_authority, score_recency, score_popularity,
-                        score_relevance, dup_penalty, cluster_id, summary_json, computed_at)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    rows,
+                    UPSERT_METRICS_SQL, rows[i : i + self.batch_size]
                 )
                 inserted += cursor.rowcount
 
@@ -415,7 +891,15 @@ class DatabaseManager:
         since: Optional[datetime] = None,
     ) -> List[Tuple[Item, Metric]]:
         """Get top-scored items with their metrics."""
-        assert self._conn is not None
+        return [pair async for pair in self.iter_top_items(category, limit, since)]
+
+    async def iter_top_items(
+        self,
+        category: Optional[str] = None,
+        limit: int = 20,
+        since: Optional[datetime] = None,
+    ) -> AsyncIterator[Tuple[Item, Metric]]:
+        """Stream top-scored items with their metrics, highest score first."""
 
         conditions = ["m.score IS NOT NULL"]
         params: list = []
@@ -424,78 +908,59 @@ class DatabaseManager:
             conditions.append("i.category = ?")
             params.append(category)
         if since:
-            conditions.append("i.published_at >= ?")
-            params.append(since.isoformat())
+            conditions.append("i.published_ts >= ?")
+            params.append(_epoch(since))
 
         where = " AND ".join(conditions)
         params.append(limit)
 
-        cursor = await self._conn.execute(
-            f"""SELECT i.*, m.score, m.score_authority, m.score_recency,
-                       m.score_popularity, m.score_relevance, m.dup_penalty,
-                       m.cluster_id, m.summary_json, m.computed_at
+        decoders = None
+        async for description, rows in self._iter_read(
+            f"""SELECT {TOP_ITEMS_COLUMNS}
                 FROM items i
                 JOIN metrics m ON m.item_id = i.id
                 WHERE {where}
                 ORDER BY m.score DESC
                 LIMIT ?""",
             params,
-        )
-        rows = await cursor.fetchall()
-
-        results = []
-        for r in rows:
-            d = dict(r)
-            item = Item.from_row(d)
-            metric = Metric.from_row({
-                "item_id": d["id"],
-                "score": d["score"],
-                "score_authority": d["score_authority"],
-                "score_recency": d["score_recency"],
-                "score_popularity": d["score_popularity"],
-                "score_relevance": d["score_relevance"],
-                "dup_penalty": d["dup_penalty"],
-                "cluster_id": d["cluster_id"],
-                "summary_json": d["summary_json"],
-                "computed_at": d["computed_at"],
-            })
-            results.append((item, metric))
-
-        return results
+        ):
+            if decoders is None:
+                decoders = Item.row_decoder(description), Metric.row_decoder(description)
+            decode_item, decode_metric = decoders
+            for r in rows:
+                yield decode_item(r), decode_metric(r)
 
     # --- Digests ---
 
     async def save_digest(self, digest: Digest) -> int:
         """Save or update a digest section. Returns the digest ID."""
-        assert self._conn is not None
-        async with self._write_lock:
-            cursor = await self._conn.execute(
+        # Serialize content_json before taking the write lock
+        row = digest.to_row()
+        async with self._transaction() as conn:
+            cursor = await conn.execute(
                 """INSERT INTO digests (date, section, content_markdown, content_json)
                    VALUES (?, ?, ?, ?)
                    ON CONFLICT(date, section) DO UPDATE SET
                        content_markdown=excluded.content_markdown,
                        content_json=excluded.content_json,
                        generated_at=CURRENT_TIMESTAMP""",
-                digest.to_row(),
+                row,
             )
-            await self._conn.commit()
-            return cursor.lastrowid or 0
+        return cursor.lastrowid or 0
 
     async def get_digest(self, date: str, section: Optional[str] = None) -> List[Digest]:
         """Get digest(s) for a date, optionally filtered by section."""
-        assert self._conn is not None
         if section:
-            cursor = await self._conn.execute(
+            description, rows = await self._read_query(
                 "SELECT * FROM digests WHERE date = ? AND section = ?",
                 (date, section),
             )
         else:
-            cursor = await self._conn.execute(
+            description, rows = await self._read_query(
                 "SELECT * FROM digests WHERE date = ? ORDER BY section",
                 (date,),
             )
-        rows = await cursor.fetchall()
-        return [Digest.from_row(dict(r)) for r in rows]
+        return [Digest.from_row(r) for r in _dict_rows(description, rows)]
 
     # --- Maintenance ---
 
@@ -506,11 +971,16 @@ class DatabaseManager:
             await self._conn.execute("VACUUM")
 
     async def optimize_fts(self) -> None:
-        """Optimize the FTS5 index for better search performance."""
-        assert self._conn is not None
-        async with self._write_lock:
-            await self._conn.execute("INSERT INTO items_fts(items_fts) VALUES('optimize')")
-            await self._conn.commit()
+        """Optimize the FTS5 index and refresh planner statistics."""
+        async with self._transaction() as conn:
+            await conn.execute("INSERT INTO items_fts(items_fts) VALUES('optimize')")
+        # Sampled ANALYZE: bounded runtime, still enough for index choice
+        await self.analyze()
+
+    async def analyze(self) -> None:
+        """Gather planner statistics for every table and index (sampled)."""
+        async with self._transaction() as conn:
+            await _apply_pragmas(conn, ("PRAGMA analysis_limit=1000", "ANALYZE"))
 
     async def integrity_check(self) -> bool:
         """Run integrity check on the database."""
@@ -520,42 +990,107 @@ class DatabaseManager:
         return row is not None and row[0] == "ok"
 
     async def get_stats(self) -> Dict[str, Any]:
-        """Get database statistics."""
-        assert self._conn is not None
-        stats: Dict[str, Any] = {}
-
-        cursor = await self._conn.execute("SELECT COUNT(*) FROM items")
-        row = await cursor.fetchone()
-        stats["total_items"] = row[0] if row else 0
-
-        cursor = await self._conn.execute("SELECT COUNT(*) FROM sources")
-        row = await cursor.fetchone()
-        stats["total_sources"] = row[0] if row else 0
-
-        cursor = await self._conn.execute("SELECT COUNT(*) FROM metrics")
-        row = await cursor.fetchone()
-        stats["total_metrics"] = row[0] if row else 0
+        """Get database statistics.
 
-        cursor = await self._conn.execute("SELECT COUNT(*) FROM digests")
-        row = await cursor.fetchone()
-        stats["total_digests"] = row[0] if row else 0
-
-        cursor = await self._conn.execute(
+        The aggregate queries run concurrently on the read pool. Results are
+        reused for up to STATS_TTL_SECONDS while no write has been committed.
+        """
+        assert self._conn is not None
+        cached = self._stats_cache
+        if (
+            cached is not None
+            and cached[0] == self._write_generation
+            and time.monotonic() - cached[1] < STATS_TTL_SECONDS
+        ):
+            return copy.deepcopy(cached[2])
+
+        generation = self._write_generation
+        queries = [
+            "SELECT COUNT(*) FROM items",
+            "SELECT COUNT(*) FROM sources",
+            "SELECT COUNT(*) FROM metrics",
+            "SELECT COUNT(*) FROM digests",
             """SELECT category, COUNT(*) as cnt FROM items
-               GROUP BY category ORDER BY cnt DESC"""
-        )
-        stats["items_by_category"] = {r["category"]: r["cnt"] for r in await cursor.fetchall()}
-
-        cursor = await self._conn.execute(
+               GROUP BY category ORDER BY cnt DESC""",
             """SELECT source_id, COUNT(*) as cnt FROM items
-               GROUP BY source_id ORDER BY cnt DESC"""
-        )
-        stats["items_by_source"] = {r["source_id"]: r["cnt"] for r in await cursor.fetchall()}
+               GROUP BY source_id ORDER BY cnt DESC""",
+            "SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()",
+        ]
+        (
+            items, sources, metrics, digests, by_category, by_source, size,
+        ) = [
+            rows
+            for _, rows in await asyncio.gather(*(self._read_query(sql) for sql in queries))
+        ]
+
+        def scalar(rows: List[Any]) -> Any:
+            return rows[0][0] if rows else 0
+
+        stats: Dict[str, Any] = {
+            "total_items": scalar(items),
+            "total_sources": scalar(sources),
+            "total_metrics": scalar(metrics),
+            "total_digests": scalar(digests),
+            "items_by_category": {r[0]: r[1] for r in by_category},
+            "items_by_source": {r[0]: r[1] for r in by_source},
+            "db_size_bytes": scalar(size),
+        }
+        self._stats_cache = (generation, time.monotonic(), stats)
+        return copy.deepcopy(stats)
+
+
+def _dict_rows(description: Any, rows: Sequence[Any]) -> List[Dict[str, Any]]:
+    """Turn read-pool rows into dicts for the from_row() constructors."""
+    names = [d[0] for d in description or ()]
+    return [dict(zip(names, r)) for r in rows]
+
+
+def _open_reader(uri: str, pragmas: Sequence[str]) -> sqlite3.Connection:
+    """Open a read-only pool connection (runs on a read-executor thread)."""
+    # check_same_thread=False: a connection is used by whichever executor
+    # thread picks up the query; _read_conn ensures one user at a time
+    conn = sqlite3.connect(
+        uri, uri=True, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+    )
+    for pragma in pragmas:
+        conn.execute(pragma).close()
+    return conn
+
+
+def _query(conn: sqlite3.Connection, sql: str, params: Sequence[Any]) -> Tuple[Any, List[Any]]:
+    """Execute a read and fetch everything (runs on a read-executor thread)."""
+    cursor = conn.execute(sql, params)
+    try:
+        return cursor.description, cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def _source_status_statement(
+    source_id: str,
+    last_fetch_at: Optional[datetime],
+    last_error: Optional[str],
+    increment_errors: bool,
+) -> Tuple[str, tuple]:
+    """(sql, params) for one update_source_status call."""
+    fetched = last_fetch_at and last_fetch_at.isoformat()
+    if not last_error:
+        return SOURCE_OK_SQL, (fetched, source_id)
+    if increment_errors:
+        return SOURCE_ERROR_INCREMENT_SQL, (last_error, fetched, source_id)
+    return SOURCE_ERROR_SQL, (last_error, fetched, source_id)
+
+
+def _epoch(dt: datetime) -> int:
+    """Unix seconds for a since bound, comparable with items.published_ts.
+
+    Naive datetimes are taken as UTC, as are stored timestamps without an offset.
+    """
+    return calendar.timegm(dt.utctimetuple())
 
-        cursor = await self._conn.execute(
-            "SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()"
-        )
-        row = await cursor.fetchone()
-        stats["db_size_bytes"] = row[0] if row else 0
 
-        return stats
+async def _apply_pragmas(conn: aiosqlite.Connection, pragmas: Sequence[str]) -> None:
+    """Run PRAGMA statements, closing each cursor (an open one blocks VACUUM)."""
+    for pragma in pragmas:
+        async with conn.execute(pragma):
+            pass
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import sqlite3
 from pathlib import Path
 from typing import Callable, Dict, List, Tuple
 
+from backend.denoise.dedup import canonical_url
+
 logger = logging.getLogger(__name__)
 
 # Each migration is (version, description, list_of_sql_statements)
@@ -15,13 +18,19 @@ MigrationStep = Tuple[int, str, List[str]]
 SCHEMA_SQL_PATH = Path(__file__).parent / "schema.sql"
 
 
+@functools.cache
+def _schema_sql() -> str:
+    """schema.sql contents, read once per process."""
+    return SCHEMA_SQL_PATH.read_text(encoding="utf-8")
+
+
 def _get_migrations() -> List[MigrationStep]:
     """Return ordered list of migrations."""
     return [
         (
             1,
             "Initial schema: sources, items, metrics, digests, FTS5, indexes",
-            [SCHEMA_SQL_PATH.read_text(encoding="utf-8")],
+            [_schema_sql()],
         ),
         (
             2,
@@ -44,9 +53,81 @@ def _get_migrations() -> List[MigrationStep]:
                 "CREATE INDEX IF NOT EXISTS idx_favorites_created ON favorites(created_at DESC);",
             ],
         ),
+        (
+            4,
+            "Add integer items.published_ts and a (category, published_ts) index",
+            [
+                # VIRTUAL: computed from published_at on read, so writers and
+                # Item.to_row are unchanged and it can never drift
+                """ALTER TABLE items ADD COLUMN published_ts INTEGER
+                   GENERATED ALWAYS AS (CAST(strftime('%s', published_at) AS INTEGER)) VIRTUAL;""",
+                # get_items_by_category filters and sorts on published_ts
+                "CREATE INDEX IF NOT EXISTS idx_items_cat_pubts ON items(category, published_ts DESC);",
+                # Left prefix of idx_items_cat_pubts; keeping both only costs writes
+                "DROP INDEX IF EXISTS idx_items_category;",
+            ],
+        ),
+        (
+            5,
+            "Persist bm25(1.0, 0.5) as the FTS rank function and optimize the index",
+            [
+                # Lets search() use ORDER BY rank, which FTS5 can evaluate top-k
+                "INSERT INTO items_fts(items_fts, rank) VALUES('rank', 'bm25(1.0, 0.5)');",
+                "INSERT INTO items_fts(items_fts) VALUES('optimize');",
+            ],
+        ),
+        (
+            6,
+            "Reindex FTS on item updates only when title or content change",
+            [
+                # items_fts is external-content, so nothing is duplicated on
+                # insert; but the original trigger rewrote the FTS entry on every
+                # UPDATE, e.g. each snapshot_path written after ingest
+                "DROP TRIGGER IF EXISTS items_au;",
+                """CREATE TRIGGER items_au AFTER UPDATE OF title, content ON items BEGIN
+                    INSERT INTO items_fts(items_fts, rowid, title, content) VALUES('delete', old.rowid, old.title, old.content);
+                    INSERT INTO items_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content);
+                END;""",
+            ],
+        ),
+        (
+            7,
+            "Drop idx_items_source, a left prefix of idx_items_source_published",
+            [
+                # Source listings and per-source counts are served (the counts
+                # as a covering index) by idx_items_source_published alone
+                "DROP INDEX IF EXISTS idx_items_source;",
+            ],
+        ),
+        (
+            8,
+            "Recompute items.url_canonical with the current canonical_url",
+            [
+                # canonical_url now upgrades http, drops www. and sorts the
+                # query; stored keys in the old form would never match again
+                """UPDATE items SET url_canonical = canonical_url(url)
+                   WHERE url_canonical IS NOT canonical_url(url);""",
+            ],
+        ),
     ]
 
 
+def _split_statements(script: str) -> List[str]:
+    """Split a SQL script into complete statements (trigger bodies stay whole)."""
+    statements: List[str] = []
+    buf = ""
+    for line in script.splitlines(keepends=True):
+        buf += line
+        if sqlite3.complete_statement(buf):
+            if buf.strip():
+                statements.append(buf.strip())
+            buf = ""
+    if buf.strip():
+        # Trailing comments, or an unterminated statement that should fail loudly
+        statements.append(buf.strip())
+    return statements
+
+
 def get_current_version(conn: sqlite3.Connection) -> int:
     """Get the current schema version, or 0 if no schema exists."""
     try:
@@ -60,9 +141,12 @@ def get_current_version(conn: sqlite3.Connection) -> int:
 
 def apply_migrations(db_path: str) -> int:
     """Apply all pending migrations. Returns the final schema version."""
-    conn = sqlite3.connect(db_path)
+    # Autocommit mode: transactions are managed explicitly below
+    conn = sqlite3.connect(db_path, isolation_level=None)
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA foreign_keys=ON")
+    # Lets data migrations apply the same URL normalization as ingest
+    conn.create_function("canonical_url", 1, canonical_url, deterministic=True)
 
     current = get_current_version(conn)
     migrations = _get_migrations()
@@ -74,17 +158,23 @@ def apply_migrations(db_path: str) -> int:
 
         logger.info("Applying migration v%d: %s", version, description)
         try:
+            # One transaction per migration: pages are written once at commit
+            # rather than per DDL statement (executescript autocommits each)
+            conn.execute("BEGIN")
+            conn.execute("PRAGMA defer_foreign_keys=ON")
             for sql in statements:
-                conn.executescript(sql)
+                for stmt in _split_statements(sql):
+                    conn.execute(stmt)
             conn.execute(
                 "INSERT INTO schema_version (version, description) VALUES (?, ?)",
                 (version, description),
             )
-            conn.commit()
+            conn.execute("COMMIT")
             applied += 1
             logger.info("Migration v%d applied successfully", version)
         except Exception:
-            conn.rollback()
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
             logger.exception("Migration v%d failed", version)
             raise
 
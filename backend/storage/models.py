@@ -6,16 +6,25 @@ import hashlib
 import json
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 from urllib.parse import urlparse, urlunparse
 
-# Use shared canonical URL logic with denoise layer for consistent dedup
-def _canonicalize_url(url: str) -> str:
-    from backend.denoise.dedup import canonical_url
-    return canonical_url(url)
+from backend.denoise.dedup import canonical_url
 
+# orjson is an optional speedup (C parser/serializer); fall back to stdlib json
+try:
+    import orjson
 
-@dataclass
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    _loads: Callable[[Any], Any] = orjson.loads
+except ImportError:  # pragma: no cover - depends on installed extras
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+@dataclass(frozen=True, slots=True)
 class Source:
     """A content source configuration and its runtime status."""
 
@@ -35,7 +44,7 @@ class Source:
     def to_row(self) -> tuple:
         return (
             self.id,
-            json.dumps(self.config),
+            _dumps(self.config),
             self.last_fetch_at.isoformat() if self.last_fetch_at else None,
             self.last_error,
             self.error_count,
@@ -46,7 +55,7 @@ class Source:
     def from_row(cls, row: Dict[str, Any]) -> Source:
         return cls(
             id=row["id"],
-            config=json.loads(row["config"]) if isinstance(row["config"], str) else row["config"],
+            config=_loads(row["config"]) if isinstance(row["config"], str) else row["config"],
             last_fetch_at=_parse_ts(row.get("last_fetch_at")),
             last_error=row.get("last_error"),
             error_count=row.get("error_count", 0),
@@ -55,7 +64,7 @@ class Source:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """A single content item (article, paper, tip)."""
 
@@ -81,9 +90,15 @@ class Item:
         return hashlib.sha256(raw).hexdigest()[:16]
 
     @staticmethod
-    def canonicalize_url(url: str) -> str:
-        """Normalize URL for deduplication (matches denoise.dedup.canonical_url)."""
-        return _canonicalize_url(url)
+    def make_ids(urls: Sequence[str], source_id: str) -> List[str]:
+        """make_id for many URLs of one source, without a method call per URL."""
+        sha256 = hashlib.sha256
+        prefix = f"{source_id}:"
+        return [sha256((prefix + url).encode("utf-8")).hexdigest()[:16] for url in urls]
+
+    # Normalize URL for deduplication: the shared (LRU-cached)
+    # denoise.dedup.canonical_url, bound directly to skip a wrapper call
+    canonicalize_url = staticmethod(canonical_url)
 
     def to_row(self) -> tuple:
         return (
@@ -99,7 +114,7 @@ class Item:
             self.ingested_at.isoformat() if self.ingested_at else None,
             self.category,
             self.language,
-            json.dumps(self.metadata) if self.metadata else None,
+            _dumps(self.metadata) if self.metadata else None,
             self.snapshot_path,
         )
 
@@ -122,8 +137,51 @@ class Item:
             snapshot_path=row.get("snapshot_path"),
         )
 
+    @classmethod
+    def row_decoder(
+        cls, description: Sequence[Sequence[Any]]
+    ) -> Callable[[Sequence[Any]], Item]:
+        """Build a row -> Item converter for a cursor's column layout.
+
+        Column positions are resolved once per query from ``cursor.description``
+        so rows are read by index instead of through a per-row dict.
+        """
+        idx = column_index(description)
+        i_id, i_source, i_url, i_canon, i_title, i_pub, i_cat, i_lang = (
+            idx[c] for c in (
+                "id", "source_id", "url", "url_canonical", "title",
+                "published_at", "category", "language",
+            )
+        )
+        i_ext, i_content, i_author, i_ingested, i_meta, i_snap = (
+            idx.get(c) for c in (
+                "external_id", "content", "author", "ingested_at", "metadata",
+                "snapshot_path",
+            )
+        )
 
-@dataclass
+        def decode(r: Sequence[Any]) -> Item:
+            return cls(
+                id=r[i_id],
+                source_id=r[i_source],
+                external_id=r[i_ext] if i_ext is not None else None,
+                url=r[i_url],
+                url_canonical=r[i_canon],
+                title=r[i_title],
+                content=r[i_content] if i_content is not None else None,
+                author=r[i_author] if i_author is not None else None,
+                published_at=_parse_ts(r[i_pub]) or datetime.min,
+                ingested_at=_parse_ts(r[i_ingested]) if i_ingested is not None else None,
+                category=r[i_cat],
+                language=r[i_lang],
+                metadata=_parse_json(r[i_meta]) if i_meta is not None else None,
+                snapshot_path=r[i_snap] if i_snap is not None else None,
+            )
+
+        return decode
+
+
+@dataclass(slots=True)
 class Metric:
     """Scoring metrics for an item."""
 
@@ -148,7 +206,7 @@ class Metric:
             self.score_relevance,
             self.dup_penalty,
             self.cluster_id,
-            json.dumps(self.summary_json) if self.summary_json else None,
+            _dumps(self.summary_json) if self.summary_json else None,
             self.computed_at.isoformat() if self.computed_at else None,
         )
 
@@ -167,8 +225,46 @@ class Metric:
             computed_at=_parse_ts(row.get("computed_at")),
         )
 
+    @classmethod
+    def row_decoder(
+        cls, description: Sequence[Sequence[Any]]
+    ) -> Callable[[Sequence[Any]], Metric]:
+        """Build a row -> Metric converter for a cursor's column layout.
+
+        Like Item.row_decoder; lets joined item+metric rows be decoded
+        without building a dict per row.
+        """
+        idx = column_index(description)
+        i_item, i_score = idx["item_id"], idx["score"]
+        i_auth, i_rec, i_pop, i_rel, i_dup, i_cluster, i_summary, i_computed = (
+            idx.get(c) for c in (
+                "score_authority", "score_recency", "score_popularity",
+                "score_relevance", "dup_penalty", "cluster_id", "summary_json",
+                "computed_at",
+            )
+        )
 
-@dataclass
+        def opt(r: Sequence[Any], i: Optional[int]) -> Any:
+            return r[i] if i is not None else None
+
+        def decode(r: Sequence[Any]) -> Metric:
+            return cls(
+                item_id=r[i_item],
+                score=r[i_score],
+                score_authority=opt(r, i_auth),
+                score_recency=opt(r, i_rec),
+                score_popularity=opt(r, i_pop),
+                score_relevance=opt(r, i_rel),
+                dup_penalty=opt(r, i_dup),
+                cluster_id=opt(r, i_cluster),
+                summary_json=_parse_json(opt(r, i_summary)),
+                computed_at=_parse_ts(opt(r, i_computed)),
+            )
+
+        return decode
+
+
+@dataclass(slots=True)
 class Digest:
     """A generated daily digest section."""
 
@@ -184,7 +280,7 @@ class Digest:
             self.date,
             self.section,
             self.content_markdown,
-            json.dumps(self.content_json),
+            _dumps(self.content_json),
         )
 
     @classmethod
@@ -237,16 +333,27 @@ class IngestSummary:
 
 # --- Helpers ---
 
+def column_index(description: Sequence[Sequence[Any]]) -> Dict[str, int]:
+    """Map column names to positions from a DB-API ``cursor.description``."""
+    return {d[0]: i for i, d in enumerate(description)}
+
+
 def _parse_ts(val: Any) -> Optional[datetime]:
     """Parse a timestamp string or return None."""
     if val is None:
         return None
     if isinstance(val, datetime):
         return val
+    # Fast path: to_row() always writes isoformat() and SQLite's CURRENT_TIMESTAMP
+    # is ISO-8601 too, so dateutil is only needed for foreign formats
+    try:
+        return datetime.fromisoformat(str(val))
+    except ValueError:
+        pass
     try:
         from dateutil.parser import parse
         return parse(str(val))
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, OverflowError):
         return None
 
 
@@ -257,6 +364,6 @@ def _parse_json(val: Any) -> Optional[Dict[str, Any]]:
     if isinstance(val, dict):
         return val
     try:
-        return json.loads(val)
+        return _loads(val)
     except (json.JSONDecodeError, TypeError):
         return None
@@ -10,15 +10,14 @@ from pathlib import Path
 root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(root))
 
-import yaml
 from backend.denoise.filters import ItemRecord
 from backend.digest.summarizer import LLMSummarizer
+from backend.pipeline.orchestrator import load_yaml_config
 
 
 def main() -> None:
     config_path = root / "config.yaml"
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    config = load_yaml_config(config_path)
 
     if config.get("llm", {}).get("provider") != "local":
         print("Config llm.provider is not 'local'. Set it to 'local' to test Ollama.", file=sys.stderr)
@@ -37,11 +36,18 @@ def main() -> None:
         category="news",
     )
 
-    summarizer = LLMSummarizer(config)
-    result = asyncio.run(summarizer.summarize([item]))
-    summary = result.get(item.id, "")
-
-    print("Summary:", summary)
+    async def stream_summary() -> str:
+        # Print tokens as they arrive so first-token latency is visible
+        parts = []
+        print("Summary: ", end="", flush=True)
+        async with LLMSummarizer(config) as summarizer:
+            async for delta in summarizer.stream(item):
+                parts.append(delta)
+                print(delta, end="", flush=True)
+        print()
+        return "".join(parts)
+
+    summary = asyncio.run(stream_summary())
     if not summary:
         sys.exit(1)
     print("OK: Ollama local summarizer works.")
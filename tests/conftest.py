@@ -0,0 +1,39 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from backend.storage.migrations import apply_migrations
+
+
+@pytest.fixture(scope="session")
+def migrated_db_template(tmp_path_factory) -> Path:
+    """A database with every migration applied, built once per test session.
+
+    apply_migrations closes its connection when done, which checkpoints the
+    WAL into the main file, so copying that one file gives a complete DB.
+    """
+    path = tmp_path_factory.mktemp("db_template") / "template.db"
+    apply_migrations(str(path))
+    return path
+
+
+@pytest.fixture
+def clone_migrated_db(migrated_db_template: Path) -> Callable[[Path], str]:
+    """Return a function that copies the migrated template to a given path.
+
+    DatabaseManager.initialize() then finds the schema current and skips
+    straight to opening connections.
+    """
+
+    def clone(dest: Path) -> str:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(migrated_db_template, dest)
+        return str(dest)
+
+    return clone
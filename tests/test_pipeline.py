@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
 import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
-from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import yaml
 
-from backend.pipeline.orchestrator import IngestOrchestrator, SnapshotManager
+from backend.pipeline.orchestrator import (
+    HostRateLimiter,
+    IngestOrchestrator,
+    SnapshotManager,
+    load_yaml_config,
+)
 from backend.storage.db import DatabaseManager
 from backend.storage.models import IngestResult, Item, Source
 
@@ -21,7 +26,7 @@ from backend.storage.models import IngestResult, Item, Source
 # --- Fixtures ---
 
 @pytest.fixture
-def tmp_dir(tmp_path):
+def tmp_dir(tmp_path, clone_migrated_db):
     """Return a temporary directory with config and data subdirs."""
     # Create config
     config = {
@@ -54,7 +59,7 @@ def tmp_dir(tmp_path):
     config_path.write_text(yaml.dump(config))
 
     db_path = tmp_path / "data" / "test.db"
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+    clone_migrated_db(db_path)
 
     snapshot_dir = tmp_path / "data" / "snapshots"
     snapshot_dir.mkdir(parents=True, exist_ok=True)
@@ -69,13 +74,14 @@ def tmp_dir(tmp_path):
 
 def make_raw_items(count: int = 5, source_id: str = "test_rss") -> List[Dict[str, Any]]:
     """Create raw item dicts as a connector would return."""
+    now_iso = datetime.utcnow().isoformat()
     return [
         {
             "url": f"https://example.com/article-{i}",
             "title": f"Test Article {i}",
             "content": f"Content for article {i} about AI and machine learning.",
             "author": "Test Author",
-            "published_at": datetime.utcnow().isoformat(),
+            "published_at": now_iso,
             "metadata": {"score": i * 10},
         }
         for i in range(count)
@@ -92,6 +98,14 @@ class MockConnector:
         return self._items
 
 
+class SlowConnector:
+    """Mock connector that never finishes within a test deadline."""
+
+    async def fetch(self, source: Source) -> List[Dict[str, Any]]:
+        await asyncio.sleep(60)
+        return []
+
+
 class FailingConnector:
     """Mock connector that raises an exception."""
 
@@ -102,28 +116,82 @@ class FailingConnector:
 # --- Snapshot Manager Tests ---
 
 class TestSnapshotManager:
-    def test_save_snapshot(self, tmp_path):
+    @pytest.mark.asyncio
+    async def test_save_snapshot(self, tmp_path):
         mgr = SnapshotManager(str(tmp_path / "snapshots"))
-        path = mgr.save("test_source", "https://example.com/article", "<html>content</html>")
+        path = await mgr.save("test_source", "https://example.com/article", "<html>content</html>")
         assert Path(path).exists()
         assert Path(path).read_text() == "<html>content</html>"
 
-    def test_snapshot_exists(self, tmp_path):
+    @pytest.mark.asyncio
+    async def test_snapshot_exists(self, tmp_path):
         mgr = SnapshotManager(str(tmp_path / "snapshots"))
         assert not mgr.exists("test_source", "https://example.com/article")
-        mgr.save("test_source", "https://example.com/article", "<html>test</html>")
+        await mgr.save("test_source", "https://example.com/article", "<html>test</html>")
         assert mgr.exists("test_source", "https://example.com/article")
 
-    def test_snapshot_directory_structure(self, tmp_path):
+    def test_save_sync(self, tmp_path):
         mgr = SnapshotManager(str(tmp_path / "snapshots"))
-        mgr.save("my_source", "https://example.com/page", "<html/>")
+        path = mgr.save_sync("test_source", "https://example.com/article", "<html>sync</html>")
+        assert Path(path).read_text() == "<html>sync</html>"
+
+    @pytest.mark.asyncio
+    async def test_snapshot_directory_structure(self, tmp_path):
+        mgr = SnapshotManager(str(tmp_path / "snapshots"))
+        await mgr.save("my_source", "https://example.com/page", "<html/>")
 
         date_str = datetime.utcnow().strftime("%Y-%m-%d")
         expected_dir = tmp_path / "snapshots" / "my_source" / date_str
         assert expected_dir.exists()
-        files = list(expected_dir.iterdir())
+        files = list(expected_dir.rglob("*.html"))
         assert len(files) == 1
-        assert files[0].suffix == ".html"
+        # Sharded by the first two hex characters of the file's hash
+        assert files[0].parent.name == files[0].stem[:2]
+        assert files[0].parent.parent == expected_dir
+
+    @pytest.mark.asyncio
+    async def test_flush_syncs_pending_writes_once(self, tmp_path):
+        mgr = SnapshotManager(str(tmp_path / "snapshots"), durable=True)
+        for i in range(3):
+            await mgr.save("src", f"https://example.com/{i}", "<html/>")
+        assert await mgr.flush() == 3
+        assert await mgr.flush() == 0
+
+        lazy = SnapshotManager(str(tmp_path / "lazy"))
+        await lazy.save("src", "https://example.com/", "<html/>")
+        assert await lazy.flush() == 0
+
+    @pytest.mark.asyncio
+    async def test_compressed_snapshots(self, tmp_path):
+        mgr = SnapshotManager(str(tmp_path / "snapshots"), compress=True)
+        html = "<html>" + "<p>repeated paragraph</p>" * 500 + "</html>"
+        path = await mgr.save("src", "https://example.com/big", html)
+
+        assert path.endswith(".html.gz")
+        assert mgr.exists("src", "https://example.com/big")
+        assert Path(path).stat().st_size < len(html) // 5
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert f.read() == html
+
+
+# --- Rate Limiter Tests ---
+
+class TestHostRateLimiter:
+    @pytest.mark.asyncio
+    async def test_spaces_same_host_only(self):
+        limiter = HostRateLimiter(0.05)
+        t0 = asyncio.get_running_loop().time()
+        await asyncio.gather(
+            limiter.wait("a.example"), limiter.wait("a.example"), limiter.wait("b.example")
+        )
+        elapsed = asyncio.get_running_loop().time() - t0
+        assert 0.04 <= elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_zero_interval_never_sleeps(self):
+        limiter = HostRateLimiter(0)
+        for _ in range(100):
+            await limiter.wait("a.example")
 
 
 # --- Orchestrator Tests ---
@@ -187,6 +255,25 @@ class TestIngestOrchestrator:
         finally:
             await orchestrator.close()
 
+    @pytest.mark.asyncio
+    async def test_ingest_deadline_cancels_slow_sources(self, tmp_dir):
+        mock_factory = lambda cfg: SlowConnector()
+
+        orchestrator = IngestOrchestrator(
+            config_path=tmp_dir["config_path"],
+            db_path=tmp_dir["db_path"],
+            snapshot_dir=tmp_dir["snapshot_dir"],
+            connector_factory=mock_factory,
+            ingest_deadline=0.2,
+        )
+        await orchestrator.initialize()
+        try:
+            summary = await orchestrator.ingest_all()
+            assert summary.total_errors == 2
+            assert summary.results == []
+        finally:
+            await orchestrator.close()
+
     @pytest.mark.asyncio
     async def test_ingest_deduplicates(self, tmp_dir):
         raw_items = make_raw_items(3)
@@ -211,6 +298,77 @@ class TestIngestOrchestrator:
         finally:
             await orchestrator.close()
 
+    @pytest.mark.asyncio
+    async def test_dedup_across_runs_without_full_scan(self, tmp_dir, monkeypatch):
+        raw_items = make_raw_items(3)
+        mock_factory = lambda cfg: MockConnector(raw_items)
+        kwargs = dict(
+            config_path=tmp_dir["config_path"],
+            db_path=tmp_dir["db_path"],
+            snapshot_dir=tmp_dir["snapshot_dir"],
+            connector_factory=mock_factory,
+        )
+
+        first = IngestOrchestrator(**kwargs)
+        await first.initialize()
+        try:
+            await first.ingest_all(source_ids=["test_rss"])
+        finally:
+            await first.close()
+
+        # A one-shot run (as the CLI does) must only look up the fetched URLs,
+        # never stream the whole items table
+        scanned: List[str] = []
+        original_iter_read = DatabaseManager._iter_read
+
+        def tracking_iter_read(self, sql, params=()):
+            scanned.append(sql)
+            return original_iter_read(self, sql, params)
+
+        monkeypatch.setattr(DatabaseManager, "_iter_read", tracking_iter_read)
+
+        second = IngestOrchestrator(**kwargs)
+        await second.initialize()
+        try:
+            summary = await second.ingest_all(source_ids=["test_api"])
+            assert summary.total_duplicates == 3
+            assert summary.total_inserted == 0
+        finally:
+            await second.close()
+        assert not any("FROM items" in sql for sql in scanned)
+
+    @pytest.mark.asyncio
+    async def test_iter_ingest_yields_per_source(self, tmp_dir):
+        raw_items = make_raw_items(2)
+        orchestrator = IngestOrchestrator(
+            config_path=tmp_dir["config_path"],
+            db_path=tmp_dir["db_path"],
+            snapshot_dir=tmp_dir["snapshot_dir"],
+            connector_factory=lambda cfg: MockConnector(raw_items),
+        )
+        await orchestrator.initialize()
+        try:
+            results = [r async for r in orchestrator.iter_ingest()]
+            assert sorted(r.source_id for r in results) == ["test_api", "test_rss"]
+            assert all(r.success and r.fetched == 2 for r in results)
+        finally:
+            await orchestrator.close()
+
+    def test_sources_parsed_once_until_config_changes(self, tmp_dir):
+        orchestrator = IngestOrchestrator(
+            config_path=tmp_dir["config_path"], db_path=tmp_dir["db_path"]
+        )
+        _, sources = orchestrator._load_sources()
+        assert [s.id for s in sources] == ["test_rss", "test_api"]
+        assert orchestrator._load_sources()[1] is sources
+        assert [s.id for s in orchestrator._get_sources(sources, ["test_api"])] == ["test_api"]
+
+        path = Path(tmp_dir["config_path"])
+        path.write_text(yaml.dump({"sources": [{"id": "only", "type": "rss", "url": "u"}]}))
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert [s.id for s in orchestrator._load_sources()[1]] == ["only"]
+
     @pytest.mark.asyncio
     async def test_ingest_without_connector(self, tmp_dir):
         """Without a connector factory, sources should be skipped gracefully."""
@@ -249,6 +407,28 @@ class TestIngestOrchestrator:
         finally:
             await orchestrator.close()
 
+    @pytest.mark.asyncio
+    async def test_snapshot_paths_persisted(self, tmp_dir):
+        raw_items = make_raw_items(3)
+        mock_factory = lambda cfg: MockConnector(raw_items)
+
+        orchestrator = IngestOrchestrator(
+            config_path=tmp_dir["config_path"],
+            db_path=tmp_dir["db_path"],
+            snapshot_dir=tmp_dir["snapshot_dir"],
+            connector_factory=mock_factory,
+        )
+        await orchestrator.initialize()
+        try:
+            await orchestrator.ingest_all(source_ids=["test_rss"])
+            items = await orchestrator.db.get_items_by_source("test_rss")
+            assert len(items) == 3
+            for item in items:
+                assert item.snapshot_path is not None
+                assert Path(item.snapshot_path).exists()
+        finally:
+            await orchestrator.close()
+
     @pytest.mark.asyncio
     async def test_source_status_updated_on_error(self, tmp_dir):
         mock_factory = lambda cfg: FailingConnector()
@@ -269,6 +449,51 @@ class TestIngestOrchestrator:
         finally:
             await orchestrator.close()
 
+    @pytest.mark.asyncio
+    async def test_snapshot_options_from_config(self, tmp_dir):
+        path = Path(tmp_dir["config_path"])
+        config = yaml.safe_load(path.read_text())
+        config["performance"]["snapshots"] = {"durable": True, "compress": True}
+        path.write_text(yaml.dump(config))
+
+        orchestrator = IngestOrchestrator(
+            config_path=tmp_dir["config_path"],
+            db_path=tmp_dir["db_path"],
+            snapshot_dir=tmp_dir["snapshot_dir"],
+            connector_factory=lambda cfg: MockConnector(make_raw_items(3)),
+        )
+        await orchestrator.initialize()
+        try:
+            assert orchestrator.snapshots.durable
+            await orchestrator.ingest_all(source_ids=["test_rss"])
+            # Every source's snapshots were synced when it finished
+            assert orchestrator.snapshots._unsynced == []
+            items = await orchestrator.db.get_items_by_source("test_rss")
+            assert items and all(item.snapshot_path.endswith(".html.gz") for item in items)
+        finally:
+            await orchestrator.close()
+
+    @pytest.mark.asyncio
+    async def test_disabled_source_keeps_error_history(self, tmp_dir):
+        orchestrator = IngestOrchestrator(
+            config_path=tmp_dir["config_path"],
+            db_path=tmp_dir["db_path"],
+            snapshot_dir=tmp_dir["snapshot_dir"],
+            connector_factory=lambda cfg: FailingConnector(),
+        )
+        await orchestrator.initialize()
+        try:
+            await orchestrator.ingest_all(source_ids=["test_rss"])
+            await orchestrator.db.update_source_enabled("test_rss", False)
+
+            summary = await orchestrator.ingest_all()
+            assert [r.source_id for r in summary.results] == ["test_api"]
+            source = await orchestrator.db.get_source("test_rss")
+            assert source.error_count == 1
+            assert source.last_error is not None
+        finally:
+            await orchestrator.close()
+
 
 # --- Normalization Tests ---
 
@@ -314,6 +539,20 @@ class TestNormalization:
         assert len(items) == 0
 
 
+class TestLoadConfig:
+    def test_cached_copy_and_reload_on_change(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.dump({"sources": [{"id": "a"}]}))
+        first = load_yaml_config(path)
+        first["sources"].append({"id": "mutated"})
+        assert load_yaml_config(path) == {"sources": [{"id": "a"}]}
+
+        path.write_text(yaml.dump({"sources": [{"id": "b"}]}))
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert load_yaml_config(path) == {"sources": [{"id": "b"}]}
+
+
 # --- CLI Tests ---
 
 class TestCLI:
@@ -8,13 +8,15 @@ import os
 import sqlite3
 import tempfile
 import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import AsyncIterator
 
 import pytest
 
-from backend.storage.db import DatabaseManager
-from backend.storage.models import Digest, IngestResult, IngestSummary, Item, Metric, Source
+from backend.storage.db import BULK_INSERT_ROWS, DatabaseManager
+from backend.storage.models import Digest, IngestResult, IngestSummary, Item, Metric, Source, _parse_ts
 from backend.storage.migrations import apply_migrations, get_current_version, reset_database
 
 
@@ -27,14 +29,58 @@ def tmp_db(tmp_path):
 
 
 @pytest.fixture
-async def db(tmp_db):
-    """Return an initialized DatabaseManager."""
-    manager = DatabaseManager(tmp_db)
+async def db(tmp_db, clone_migrated_db):
+    """Return an initialized DatabaseManager (schema copied from the session template)."""
+    # Passed as a Path: DatabaseManager accepts any os.PathLike
+    manager = DatabaseManager(Path(clone_migrated_db(Path(tmp_db))))
     await manager.initialize()
     yield manager
     await manager.close()
 
 
+@pytest.fixture
+async def fast_pragmas(db):
+    """Trade durability for speed on the writer connection (perf tests only).
+
+    WAL, temp_store=MEMORY and mmap are already production settings.
+    locking_mode=EXCLUSIVE would lock out the read pool and page_size needs
+    a VACUUM of the migrated file, so neither is applied.
+    """
+    for pragma in ("PRAGMA synchronous=OFF", "PRAGMA cache_size=-64000"):
+        await db._conn.execute(pragma)
+    return db
+
+
+@pytest.fixture
+async def sqlite_stats(db, record_property):
+    """Record how much a test grew the database file and WAL (perf tests only).
+
+    The deltas land in the test report as properties (e.g. ``--junitxml``), so
+    a perf regression can be told apart as extra I/O rather than just seconds.
+    """
+
+    async def snapshot() -> dict[str, int]:
+        stats = {}
+        for pragma in ("page_count", "freelist_count"):
+            cursor = await db._conn.execute(f"PRAGMA {pragma}")
+            stats[pragma] = (await cursor.fetchone())[0]
+            await cursor.close()
+        wal = Path(f"{db.db_path}-wal")
+        stats["wal_bytes"] = wal.stat().st_size if wal.exists() else 0
+        return stats
+
+    before = await snapshot()
+    yield
+    after = await snapshot()
+    for name, value in after.items():
+        record_property(f"sqlite_{name}_delta", value - before[name])
+
+
+# One timestamp for the whole module: utcnow() per generated item adds up in the
+# 10k perf tests, and shared values keep generated rows deterministic
+_NOW = datetime.utcnow()
+
+
 def make_item(
     source_id: str = "test_source",
     url: str = "https://example.com/article-1",
@@ -42,11 +88,10 @@ def make_item(
     category: str = "news",
     language: str = "en",
     content: str = "This is test content about AI and LLMs.",
-    published_at: datetime = None,
+    published_at: datetime = _NOW,
+    ingested_at: datetime = _NOW,
 ) -> Item:
     """Create a test Item."""
-    if published_at is None:
-        published_at = datetime.utcnow()
     canonical = Item.canonicalize_url(url)
     item_id = Item.make_id(url, source_id)
     return Item(
@@ -59,10 +104,60 @@ def make_item(
         language=language,
         content=content,
         published_at=published_at,
-        ingested_at=datetime.utcnow(),
+        ingested_at=ingested_at,
     )
 
 
+def make_items_bulk(
+    n: int,
+    url_fmt: str,
+    title_fmt: str,
+    content_fmt: str,
+    source_id: str = "test_source",
+) -> list[Item]:
+    """Create n test Items for the perf tests, skipping make_item's per-call work.
+
+    The formats take the item index via %-formatting; url_fmt must already be
+    canonical (https, no www., no trailing slash) since it is used as-is.
+    """
+    urls = [url_fmt % i for i in range(n)]
+    items = []
+    for i, (url, item_id) in enumerate(zip(urls, Item.make_ids(urls, source_id))):
+        items.append(Item(
+            id=item_id,
+            source_id=source_id,
+            url=url,
+            url_canonical=url,
+            title=title_fmt % i,
+            category="news",
+            language="en",
+            content=content_fmt % i,
+            published_at=_NOW,
+            ingested_at=_NOW,
+        ))
+    return items
+
+
+@asynccontextmanager
+async def traced_transactions(db: DatabaseManager) -> AsyncIterator[list[str]]:
+    """Collect the BEGIN/COMMIT statements the writer runs inside the block.
+
+    Tracing expands every statement's SQL, once per trigger step too, so keep
+    it out of timed code.
+    """
+    statements: list[str] = []
+
+    def trace(sql: str) -> None:
+        if sql.startswith(("BEGIN", "COMMIT")):
+            statements.append(sql)
+
+    await db._conn.set_trace_callback(trace)
+    try:
+        yield statements
+    finally:
+        await db._conn.set_trace_callback(None)
+
+
 def make_source(source_id: str = "test_source") -> Source:
     """Create a test Source."""
     return Source(
@@ -124,6 +219,143 @@ class TestMigrations:
         conn.close()
         assert count == 0
 
+    def test_url_canonical_recomputed(self, tmp_db):
+        version = apply_migrations(tmp_db)
+        conn = sqlite3.connect(tmp_db)
+        conn.execute(
+            "INSERT INTO sources (id, config) VALUES (?, ?)",
+            ("test", '{"id": "test"}'),
+        )
+        # Stored in the older canonical form, as before the recanonicalization
+        conn.execute(
+            """INSERT INTO items (id, source_id, url, url_canonical, title,
+                                  published_at, category, language)
+               VALUES ('i1', 'test', ?, ?, 'T', '2025-01-15T10:00:00', 'news', 'en')""",
+            ("http://www.example.com/a/?b=2&a=1", "http://www.example.com/a?b=2&a=1"),
+        )
+        conn.execute("DELETE FROM schema_version WHERE version = 8")
+        conn.commit()
+        conn.close()
+
+        assert apply_migrations(tmp_db) == version
+        conn = sqlite3.connect(tmp_db)
+        stored = conn.execute("SELECT url_canonical FROM items").fetchone()[0]
+        conn.close()
+        assert stored == Item.canonicalize_url("http://www.example.com/a/?b=2&a=1")
+        assert stored == "https://example.com/a?a=1&b=2"
+
+    def test_category_listing_uses_composite_index(self, tmp_db):
+        apply_migrations(tmp_db)
+        conn = sqlite3.connect(tmp_db)
+        plan = conn.execute(
+            """EXPLAIN QUERY PLAN SELECT * FROM items
+               WHERE category = ? AND published_ts >= ?
+               ORDER BY published_ts DESC LIMIT ?""",
+            ("news", 1735689600, 10),
+        ).fetchall()
+        conn.close()
+        details = " ".join(row[-1] for row in plan)
+        assert "idx_items_cat_pubts" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_query_plan_uses_index(self, tmp_db):
+        apply_migrations(tmp_db)
+        conn = sqlite3.connect(tmp_db)
+
+        def plan(sql, params):
+            return " ".join(r[-1] for r in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+        # Listings need whole rows, but must not scan or sort
+        listing = plan(
+            "SELECT * FROM items WHERE source_id = ? ORDER BY published_at DESC LIMIT ? OFFSET ?",
+            ("src", 10, 0),
+        )
+        assert "USING INDEX idx_items_source_published" in listing
+        assert "TEMP B-TREE" not in listing
+        # Narrow lookups are answered from the index alone
+        assert "USING COVERING INDEX idx_items_canonical" in plan(
+            "SELECT url_canonical FROM items WHERE url_canonical IN (?, ?)", ("a", "b")
+        )
+        assert "USING COVERING INDEX idx_items_source_published" in plan(
+            "SELECT COUNT(*) FROM items WHERE source_id = ?", ("src",)
+        )
+        conn.close()
+
+    def test_split_statements_keeps_trigger_bodies(self):
+        from backend.storage.migrations import SCHEMA_SQL_PATH, _split_statements
+
+        statements = _split_statements(SCHEMA_SQL_PATH.read_text(encoding="utf-8"))
+        triggers = [s for s in statements if "CREATE TRIGGER" in s]
+        assert len(triggers) == 3
+        assert all(t.rstrip().endswith("END;") for t in triggers)
+
+    def test_fts_rank_function_configured(self, tmp_db):
+        apply_migrations(tmp_db)
+        conn = sqlite3.connect(tmp_db)
+        rank = conn.execute("SELECT v FROM items_fts_config WHERE k = 'rank'").fetchone()
+        conn.close()
+        assert rank == ("bm25(1.0, 0.5)",)
+
+    def test_fts_is_external_content(self, tmp_db):
+        """items_fts indexes items in place; there must be no copied content table."""
+        apply_migrations(tmp_db)
+        conn = sqlite3.connect(tmp_db)
+        tables = {
+            r[0]
+            for r in conn.execute(
+                "SELECT name FROM sqlite_master WHERE name LIKE 'items_fts%'"
+            ).fetchall()
+        }
+        conn.close()
+        assert "items_fts_data" in tables
+        assert "items_fts_content" not in tables
+
+    @pytest.mark.asyncio
+    async def test_fts_reindexed_only_on_text_updates(self, db):
+        await db.upsert_source(make_source())
+        item = make_item(url="https://example.com/fts-update", title="Original headline")
+        await db.batch_insert_items([item])
+
+        statements: list[str] = []
+        await db._conn.set_trace_callback(statements.append)
+        try:
+            await db.batch_update_snapshot_paths([(item.id, "snap.html")])
+        finally:
+            await db._conn.set_trace_callback(None)
+        assert not any("items_fts" in sql for sql in statements)
+
+        async with db._transaction() as conn:
+            await conn.execute(
+                "UPDATE items SET title = ? WHERE id = ?", ("Rewritten headline", item.id)
+            )
+            await conn.execute("INSERT INTO items_fts(items_fts) VALUES('integrity-check')")
+        assert [r.id for r in await db.search("rewritten")] == [item.id]
+        assert await db.search("original") == []
+
+    @pytest.mark.asyncio
+    async def test_initialize_restores_fts_trigger_after_interrupted_bulk_load(
+        self, tmp_db, clone_migrated_db
+    ):
+        path = clone_migrated_db(Path(tmp_db))
+        manager = DatabaseManager(path)
+        await manager.initialize()
+        await manager.upsert_source(make_source())
+        async with manager._transaction() as conn:
+            await conn.execute("DROP TRIGGER items_ai")  # as if killed in bulk_mode()
+        await manager.batch_insert_items([make_item(title="Orphaned bulk row")])
+        await manager.close()
+
+        manager = DatabaseManager(path)
+        await manager.initialize()
+        try:
+            assert len(await manager.search("orphaned")) == 1
+            await manager.batch_insert_items(
+                [make_item(url="https://example.com/after", title="Indexed again")]
+            )
+            assert len(await manager.search("indexed")) == 1
+        finally:
+            await manager.close()
+
     def test_wal_mode_enabled(self, tmp_db):
         apply_migrations(tmp_db)
         conn = sqlite3.connect(tmp_db)
@@ -141,6 +373,11 @@ class TestModels:
         id3 = Item.make_id("https://example.com/b", "src1")
         assert id1 == id2
         assert id1 != id3
+        assert len(id1) == 16
+
+    def test_item_make_ids_matches_make_id(self):
+        urls = ["https://example.com/a", "https://example.com/b", "https://example.com/日本"]
+        assert Item.make_ids(urls, "src1") == [Item.make_id(u, "src1") for u in urls]
 
     def test_item_canonicalize_url(self):
         assert Item.canonicalize_url("https://www.example.com/path/") == "https://example.com/path"
@@ -152,6 +389,14 @@ class TestModels:
         row = item.to_row()
         assert len(row) == 14
 
+    def test_parse_ts_formats(self):
+        assert _parse_ts("2025-01-15T10:00:00") == datetime(2025, 1, 15, 10, 0, 0)
+        assert _parse_ts("2025-01-15 10:00:00") == datetime(2025, 1, 15, 10, 0, 0)
+        assert _parse_ts("2025-01-15T10:00:00Z").tzinfo is not None
+        assert _parse_ts("Wed, 15 Jan 2025 10:00:00 GMT").year == 2025
+        assert _parse_ts("not a date") is None
+        assert _parse_ts(None) is None
+
     def test_source_from_config(self):
         cfg = {"id": "test", "type": "rss", "url": "https://example.com/feed"}
         source = Source.from_config(cfg)
@@ -176,6 +421,20 @@ class TestDatabaseManager:
     async def test_initialize(self, db):
         assert db._conn is not None
 
+    @pytest.mark.asyncio
+    async def test_performance_pragmas(self, db):
+        async def pragma(name):
+            cursor = await db._conn.execute(f"PRAGMA {name}")
+            row = await cursor.fetchone()
+            await cursor.close()
+            return row[0]
+
+        assert await pragma("journal_mode") == "wal"
+        assert await pragma("synchronous") == 1  # NORMAL
+        assert await pragma("temp_store") == 2  # MEMORY
+        assert await pragma("journal_size_limit") == 67108864
+        assert await pragma("busy_timeout") == 5000
+
     @pytest.mark.asyncio
     async def test_upsert_and_get_source(self, db):
         source = make_source()
@@ -194,6 +453,32 @@ class TestDatabaseManager:
         sources = await db.get_enabled_sources()
         assert len(sources) == 2
 
+    @pytest.mark.asyncio
+    async def test_enabled_sources_cache_invalidated_by_writes(self, db):
+        await db.upsert_source(make_source("src1"))
+        first = await db.get_enabled_sources()
+        first.clear()  # callers get their own list
+        assert (await db.get_enabled_sources())[0].enabled is True
+
+        await db.update_source_enabled("src1", False)
+        assert await db.get_enabled_sources() == []
+
+        await db.update_source_enabled("src1", True)
+        await db.update_source_status("src1", last_error="boom", increment_errors=True)
+        sources = await db.get_enabled_sources()
+        assert sources[0].last_error == "boom"
+
+    @pytest.mark.asyncio
+    async def test_sync_sources_and_get_disabled(self, db):
+        await db.upsert_source(make_source("src1"))
+        await db.update_source_enabled("src1", False)
+
+        disabled = await db.sync_sources_and_get_disabled(
+            [make_source("src1"), make_source("src2")]
+        )
+        assert disabled == {"src1"}
+        assert await db.get_source("src2") is not None
+
     @pytest.mark.asyncio
     async def test_update_source_status(self, db):
         await db.upsert_source(make_source())
@@ -216,6 +501,28 @@ class TestDatabaseManager:
         assert source.last_error == "timeout"
         assert source.error_count == 1
 
+    @pytest.mark.asyncio
+    async def test_update_source_statuses(self, db):
+        for source_id in ("src1", "src2", "src3"):
+            await db.upsert_source(make_source(source_id))
+        now = datetime.utcnow()
+
+        generation = db._write_generation
+        await db.update_source_statuses([
+            ("src1", now, "timeout", True),
+            ("src2", now, "timeout", True),
+            ("src3", now, None, False),
+        ])
+        assert db._write_generation == generation + 1
+
+        for source_id in ("src1", "src2"):
+            source = await db.get_source(source_id)
+            assert source.last_error == "timeout"
+            assert source.error_count == 1
+        source = await db.get_source("src3")
+        assert source.last_error is None
+        assert source.last_fetch_at is not None
+
     @pytest.mark.asyncio
     async def test_batch_insert_items(self, db):
         await db.upsert_source(make_source())
@@ -276,6 +583,127 @@ class TestDatabaseManager:
         news = await db.get_items_by_category("news")
         assert len(news) == 1
 
+    @pytest.mark.asyncio
+    async def test_insert_items_bulk(self, db):
+        await db.upsert_source(make_source())
+        count = BULK_INSERT_ROWS * 2 + 5  # two multi-row chunks plus a tail
+        items = [make_item(url=f"https://example.com/bulk-{i}") for i in range(count)]
+
+        assert await db.insert_items_bulk(items) == count
+        assert await db.insert_items_bulk(items) == 0
+        assert await db.count_items() == count
+        stored = await db.get_item(items[-1].id)
+        assert stored.url == items[-1].url
+
+    @pytest.mark.asyncio
+    async def test_batch_insert_uses_immediate(self, db):
+        await db.upsert_source(make_source())
+        statements: list[str] = []
+        await db._conn.set_trace_callback(statements.append)
+        try:
+            await db.batch_insert_items([make_item(url="https://example.com/immediate")])
+        finally:
+            await db._conn.set_trace_callback(None)
+
+        begins = [sql for sql in statements if sql.startswith("BEGIN")]
+        assert begins == ["BEGIN IMMEDIATE"]
+        assert statements[-1] == "COMMIT"
+
+    @pytest.mark.asyncio
+    async def test_chunked_inserts_commit_once(self, db):
+        await db.upsert_source(make_source())
+        db.batch_size = 10
+        items = make_items_bulk(35, "https://example.com/batch-%d", "Batch %d", "Body %d")
+        async with traced_transactions(db) as statements:
+            assert await db.batch_insert_items(items) == 35
+        assert statements == ["BEGIN IMMEDIATE", "COMMIT"]
+
+        # Two full multi-row chunks plus a short tail
+        count = 2 * BULK_INSERT_ROWS + 5
+        rows = make_items_bulk(count, "https://example.com/rows-%d", "Row %d", "Body %d")
+        async with traced_transactions(db) as statements:
+            assert await db.batch_insert_rows(item.to_row() for item in rows) == count
+        assert statements == ["BEGIN IMMEDIATE", "COMMIT"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_read_pool(self, db):
+        await db.upsert_source(make_source())
+        items = [make_item(url=f"https://example.com/pool-{i}") for i in range(20)]
+        await db.batch_insert_items(items)
+
+        fetched = await asyncio.gather(*(db.get_item(item.id) for item in items))
+        assert [f.id for f in fetched] == [item.id for item in items]
+        assert db._read_idle.qsize() == len(db._read_conns)
+        # Grown on demand from the one connection initialize() opened
+        assert 1 < len(db._read_conns) <= db.read_pool_size
+
+    @pytest.mark.asyncio
+    async def test_read_pool_size_one(self, tmp_db, clone_migrated_db):
+        manager = DatabaseManager(clone_migrated_db(Path(tmp_db)), read_pool_size=1)
+        await manager.initialize()
+        try:
+            await manager.upsert_source(make_source())
+            items = [make_item(url=f"https://example.com/single-{i}") for i in range(5)]
+            await manager.batch_insert_items(items)
+            fetched = await asyncio.gather(*(manager.get_item(item.id) for item in items))
+            assert [f.id for f in fetched] == [item.id for item in items]
+            assert len(manager._read_conns) == 1
+        finally:
+            await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_pool_reads_inside_stream(self, tmp_db, clone_migrated_db):
+        manager = DatabaseManager(clone_migrated_db(Path(tmp_db)), read_pool_size=1)
+        await manager.initialize()
+        try:
+            await manager.upsert_source(make_source())
+            items = [make_item(url=f"https://example.com/nested-{i}") for i in range(3)]
+            await manager.batch_insert_items(items)
+
+            async def walk() -> list[str]:
+                # Each get_item needs the only pool connection mid-stream
+                return [
+                    (await manager.get_item(item.id)).id
+                    async for item in manager.iter_items_by_source("test_source")
+                ]
+
+            assert sorted(await asyncio.wait_for(walk(), timeout=5)) == sorted(
+                item.id for item in items
+            )
+            assert len(manager._stream_idle) == 1
+        finally:
+            await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_iter_items_streams_same_rows(self, db):
+        await db.upsert_source(make_source())
+        await db.batch_insert_items(
+            [make_item(url=f"https://example.com/stream-{i}", title=f"Stream {i}") for i in range(150)]
+        )
+
+        streamed = [item.id async for item in db.iter_items_by_source("test_source", limit=200)]
+        listed = [item.id for item in await db.get_items_by_source("test_source", limit=200)]
+        assert len(streamed) == 150
+        assert streamed == listed
+
+        hits = [item async for item in db.iter_search("Stream", limit=5)]
+        assert len(hits) == 5
+
+    @pytest.mark.asyncio
+    async def test_get_items_by_category_since_respects_offsets(self, db):
+        from datetime import timezone
+
+        await db.upsert_source(make_source())
+        jst = timezone(timedelta(hours=9))
+        await db.batch_insert_items([
+            # 01:00 UTC: sorts after the bound as a string, but is earlier
+            make_item(url="https://example.com/jst", published_at=datetime(2025, 1, 15, 10, tzinfo=jst)),
+            make_item(url="https://example.com/utc", published_at=datetime(2025, 1, 15, 3)),
+        ])
+
+        recent = await db.get_items_by_category("news", since=datetime(2025, 1, 15, 2))
+        assert [i.url for i in recent] == ["https://example.com/utc"]
+
     @pytest.mark.asyncio
     async def test_item_exists(self, db):
         await db.upsert_source(make_source())
@@ -292,10 +720,41 @@ class TestDatabaseManager:
         await db.batch_insert_items([item])
         assert await db.url_canonical_exists(item.url_canonical)
 
+    @pytest.mark.asyncio
+    async def test_bulk_exists(self, db):
+        await db.upsert_source(make_source())
+        items = [make_item(url=f"https://example.com/e-{i}") for i in range(3)]
+        await db.batch_insert_items(items[:2])
+
+        assert await db.items_exist([i.id for i in items]) == {items[0].id, items[1].id}
+        assert await db.url_canonicals_exist(
+            [i.url_canonical for i in items]
+        ) == {items[0].url_canonical, items[1].url_canonical}
+        assert await db.items_exist([]) == set()
+
 
 # --- FTS Search Tests ---
 
 class TestSearch:
+    @pytest.mark.asyncio
+    async def test_search_cache_invalidated_by_writes(self, db):
+        await db.upsert_source(make_source())
+        await db.batch_insert_items(
+            [make_item(url="https://example.com/cache-1", title="Transformer internals")]
+        )
+
+        first = await db.search("transformer")
+        assert len(first) == 1
+        first[0].title = "mutated"  # callers get copies
+        again = await db.search("  transformer ")
+        assert again[0].title == "Transformer internals"
+        assert len(db._search_cache) == 1
+
+        await db.batch_insert_items(
+            [make_item(url="https://example.com/cache-2", title="Transformer scaling")]
+        )
+        assert len(await db.search("transformer")) == 2
+
     @pytest.mark.asyncio
     async def test_basic_search(self, db):
         await db.upsert_source(make_source())
@@ -368,6 +827,24 @@ class TestSearch:
         assert len(results) == 1
         assert results[0].language == "en"
 
+    @pytest.mark.asyncio
+    async def test_search_with_source_and_since_filters(self, db):
+        await db.upsert_source(make_source("src1"))
+        await db.upsert_source(make_source("src2"))
+        now = datetime.utcnow()
+        items = [
+            make_item(source_id="src1", url="https://example.com/old", title="Agents old",
+                      published_at=now - timedelta(days=10)),
+            make_item(source_id="src1", url="https://example.com/new", title="Agents new",
+                      published_at=now),
+            make_item(source_id="src2", url="https://example.com/other", title="Agents other",
+                      published_at=now),
+        ]
+        await db.batch_insert_items(items)
+
+        results = await db.search("agents", source_id="src1", since=now - timedelta(days=1))
+        assert [r.title for r in results] == ["Agents new"]
+
     @pytest.mark.asyncio
     async def test_search_count(self, db):
         await db.upsert_source(make_source())
@@ -383,6 +860,13 @@ class TestSearch:
 
         count = await db.search_count("artificial intelligence")
         assert count == 10
+        assert ("count", "artificial intelligence") in db._search_cache
+        assert await db.search_count(" artificial  intelligence") == 10
+
+        await db.batch_insert_items([make_item(
+            url="https://example.com/ai-new", content="Artificial intelligence again"
+        )])
+        assert await db.search_count("artificial intelligence") == 11
 
     @pytest.mark.asyncio
     async def test_search_japanese(self, db):
@@ -404,19 +888,19 @@ class TestSearch:
 
 # --- Performance Tests ---
 
+@pytest.mark.usefixtures("fast_pragmas", "sqlite_stats")
+@pytest.mark.xdist_group("perf")
 class TestPerformance:
     @pytest.mark.asyncio
     async def test_batch_insert_10k(self, db):
         """10K items should insert in under 5 seconds."""
         await db.upsert_source(make_source())
-        items = [
-            make_item(
-                url=f"https://example.com/perf-{i}",
-                title=f"Performance Test Article {i}",
-                content=f"Content for performance test article number {i} about AI topics.",
-            )
-            for i in range(10_000)
-        ]
+        items = make_items_bulk(
+            10_000,
+            "https://example.com/perf-%d",
+            "Performance Test Article %d",
+            "Content for performance test article number %d about AI topics.",
+        )
 
         t0 = time.monotonic()
         inserted = await db.batch_insert_items(items)
@@ -425,19 +909,66 @@ class TestPerformance:
         assert inserted == 10_000
         assert elapsed < 5.0, f"Batch insert took {elapsed:.2f}s (limit: 5s)"
 
+    @pytest.mark.asyncio
+    async def test_batch_insert_rows_10k(self, db):
+        """Row tuples stream from a generator into one multi-row VALUES transaction."""
+        await db.upsert_source(make_source())
+        now = _NOW.isoformat()
+        # A generator, not a list: batch_insert_rows pulls one chunk at a time
+        rows = (
+            (
+                Item.make_id(url, "test_source"), "test_source", None, url, url,
+                f"Row Article {i}", f"Row content {i}", None, now, now, "news", "en",
+                None, None,
+            )
+            for i, url in enumerate(f"https://example.com/row-{i}" for i in range(10_000))
+        )
+
+        t0 = time.monotonic()
+        inserted = await db.batch_insert_rows(rows)
+        elapsed = time.monotonic() - t0
+
+        assert inserted == 10_000
+        assert elapsed < 5.0, f"Row insert took {elapsed:.2f}s (limit: 5s)"
+        assert await db.count_items() == 10_000
+
+    @pytest.mark.asyncio
+    async def test_bulk_mode_insert_10k(self, db):
+        """Bulk mode defers FTS indexing to one rebuild; search works afterwards."""
+        await db.upsert_source(make_source())
+        items = make_items_bulk(
+            10_000,
+            "https://example.com/bulk-mode-%d",
+            "Bulk loaded article %d",
+            "Content %d about vector databases.",
+        )
+
+        t0 = time.monotonic()
+        async with db.bulk_mode():
+            inserted = await db.insert_items_bulk(items)
+            assert await db.search("vector databases") == []  # not indexed yet
+        elapsed = time.monotonic() - t0
+
+        assert inserted == 10_000
+        assert elapsed < 5.0, f"Bulk-mode insert took {elapsed:.2f}s (limit: 5s)"
+        assert await db.search_count("vector databases") == 10_000
+        async with db._transaction() as conn:
+            await conn.execute("INSERT INTO items_fts(items_fts) VALUES('integrity-check')")
+
     @pytest.mark.asyncio
     async def test_search_speed_10k(self, db):
         """FTS search on 10K items should be under 1 second."""
         await db.upsert_source(make_source())
-        items = [
-            make_item(
-                url=f"https://example.com/search-perf-{i}",
-                title=f"Article about AI agents and RAG systems {i}",
-                content=f"Content {i}: Large language models are used for retrieval augmented generation.",
-            )
-            for i in range(10_000)
-        ]
+        items = make_items_bulk(
+            10_000,
+            "https://example.com/search-perf-%d",
+            "Article about AI agents and RAG systems %d",
+            "Content %d: Large language models are used for retrieval augmented generation.",
+        )
         await db.batch_insert_items(items)
+        await db.analyze()
+        _, stats = await db._read_query("SELECT tbl, idx FROM sqlite_stat1 WHERE tbl = 'items'")
+        assert stats
 
         t0 = time.monotonic()
         results = await db.search("language models RAG")
@@ -465,6 +996,24 @@ class TestMetrics:
         count = await db.upsert_metrics([metric])
         assert count == 1
 
+    @pytest.mark.asyncio
+    async def test_upsert_metrics_updates_in_place(self, db):
+        await db.upsert_source(make_source())
+        item = make_item()
+        await db.batch_insert_items([item])
+
+        await db.upsert_metrics([Metric(item_id=item.id, score=0.1)])
+        cursor = await db._conn.execute("SELECT rowid FROM metrics WHERE item_id = ?", (item.id,))
+        rowid = (await cursor.fetchone())[0]
+
+        await db.upsert_metrics([Metric(item_id=item.id, score=0.9)])
+        cursor = await db._conn.execute(
+            "SELECT rowid, score FROM metrics WHERE item_id = ?", (item.id,)
+        )
+        row = await cursor.fetchone()
+        assert row[0] == rowid
+        assert row[1] == pytest.approx(0.9)
+
     @pytest.mark.asyncio
     async def test_get_top_items(self, db):
         await db.upsert_source(make_source())
@@ -475,7 +1024,7 @@ class TestMetrics:
         await db.batch_insert_items(items)
 
         metrics = [
-            Metric(item_id=item.id, score=0.5 + i * 0.1)
+            Metric(item_id=item.id, score=0.5 + i * 0.1, summary_json={"rank": i})
             for i, item in enumerate(items)
         ]
         await db.upsert_metrics(metrics)
@@ -484,6 +1033,10 @@ class TestMetrics:
         assert len(top) == 3
         # Should be ordered by score DESC
         assert top[0][1].score >= top[1][1].score
+        item, metric = top[0]
+        assert item.title == "Top 4"
+        assert metric.item_id == item.id
+        assert metric.summary_json == {"rank": 4}
 
 
 # --- Digest Tests ---
@@ -535,6 +1088,10 @@ class TestMaintenance:
     @pytest.mark.asyncio
     async def test_optimize_fts(self, db):
         await db.optimize_fts()  # Should not raise
+        cursor = await db._conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        )
+        assert (await cursor.fetchone())[0] == 1
 
     @pytest.mark.asyncio
     async def test_integrity_check(self, db):
@@ -547,3 +1104,13 @@ class TestMaintenance:
         assert "total_items" in stats
         assert "total_sources" in stats
         assert stats["total_items"] == 0
+
+    @pytest.mark.asyncio
+    async def test_get_stats_refreshes_after_write(self, db):
+        await db.get_stats()
+        await db.upsert_source(make_source())
+        await db.batch_insert_items([make_item()])
+
+        stats = await db.get_stats()
+        assert stats["total_items"] == 1
+        assert stats["items_by_source"] == {"test_source": 1}